@@ -3,7 +3,7 @@ MindMapドメインモデル
 
 マインドマップ全体を管理するクラス
 """
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from src.domain.node import Node
 
 
@@ -51,37 +51,40 @@ class MindMap:
         Returns:
             全ノードのリスト（深さ優先探索順）
         """
-        if self._root is None:
-            return []
-
-        nodes: List[Node] = []
-        self._collect_nodes(self._root, nodes)
-        return nodes
+        return list(self._iter_nodes())
 
-    def _collect_nodes(self, node: Node, nodes: List[Node]) -> None:
+    def _iter_nodes(self) -> Iterator[Node]:
         """
-        ノードを再帰的に収集する（深さ優先探索）
+        ノードを深さ優先探索順に1つずつ返す
 
-        Args:
-            node: 現在のノード
-            nodes: ノードを格納するリスト
+        明示的なスタックでたどるため、深いツリーでも再帰の上限に達しない
+
+        Yields:
+            ノード
         """
-        nodes.append(node)
-        for child in node.children:
-            self._collect_nodes(child, nodes)
+        if self._root is None:
+            return
+
+        stack: List[Node] = [self._root]
+        while stack:
+            node = stack.pop()
+            yield node
+            # 先頭の子から取り出されるように逆順に積む
+            stack.extend(reversed(node.children))
 
     def find_node_by_id(self, node_id: str) -> Optional[Node]:
         """
         IDでノードを検索する
 
+        全ノードのリストを作らずにたどり、見つかった時点で打ち切る
+
         Args:
             node_id: 検索するノードのID
 
         Returns:
             見つかったノード、見つからない場合はNone
         """
-        all_nodes = self.get_all_nodes()
-        for node in all_nodes:
+        for node in self._iter_nodes():
             if node.id == node_id:
                 return node
         return None
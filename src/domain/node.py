@@ -3,13 +3,54 @@ Nodeドメインモデル
 
 マインドマップの各ノード（節点）を表現するクラス
 """
-from typing import Optional, List, Tuple
-import uuid
+from typing import Optional, List, Tuple, Dict
+from itertools import count
+
+
+# ノードIDの連番（IDはプロセス内で一意であればよく、保存もしないため乱数は使わない）
+_node_ids = count(1)
+# 共有するテキストの長さの上限（長い段落まで登録して表を膨らませない）
+_INTERN_MAX_LENGTH = 64
+# 共有するテキストの表の大きさの上限（編集途中のテキストが溜まり続けないようにする）
+_INTERN_TABLE_SIZE = 4096
+# テキスト→共有する文字列オブジェクトの表（sys.internと違い、表を捨てれば文字列も解放される）
+_interned_texts: Dict[str, str] = {}
+
+
+def _intern_text(text: str) -> str:
+    """
+    短いテキストを共有の文字列オブジェクトに置き換える
+
+    「TODO」のように同じテキストのノードが多いため、同じ文字列オブジェクトを共有させる
+
+    Args:
+        text: ノードのテキスト
+
+    Returns:
+        共有の文字列オブジェクト（長いテキストや文字列以外はそのまま）
+    """
+    if type(text) is not str or len(text) >= _INTERN_MAX_LENGTH:
+        return text
+
+    interned = _interned_texts.get(text)
+    if interned is None:
+        # 表が一杯になったら作り直す（既存のノードのテキストはそのまま使える）
+        if len(_interned_texts) >= _INTERN_TABLE_SIZE:
+            _interned_texts.clear()
+        _interned_texts[text] = text
+        interned = text
+    return interned
 
 
 class Node:
     """マインドマップのノード"""
 
+    # 属性を固定し、インスタンスごとの__dict__を持たない（ノード数に比例するメモリと属性アクセスを軽くする）
+    __slots__ = (
+        '_id', '_text', '_parent', '_children', '_position',
+        '_font_size', '_font_color', '_manual_position',
+    )
+
     def __init__(self, text: str, font_size: Optional[int] = None, font_color: Optional[str] = None) -> None:
         """
         ノードを初期化する
@@ -19,10 +60,11 @@ class Node:
             font_size: フォントサイズ（Noneの場合はデフォルト）
             font_color: フォント色（Noneの場合はデフォルト、カラーコード文字列）
         """
-        self._id: str = str(uuid.uuid4())
-        self._text: str = text
+        self._id: str = f"node-{next(_node_ids)}"
+        self._text: str = _intern_text(text)
         self._parent: Optional[Node] = None
-        self._children: List[Node] = []
+        # 子ノードのリスト（葉ノードが多いため、最初の子を追加するまでは作らない）
+        self._children: Optional[List[Node]] = None
         self._position: Tuple[int, int] = (0, 0)
         self._font_size: Optional[int] = font_size
         self._font_color: Optional[str] = font_color  # カラーコード（例: "#FF0000"）
@@ -41,7 +83,7 @@ class Node:
     @text.setter
     def text(self, value: str) -> None:
         """ノードのテキストを設定"""
-        self._text = value
+        self._text = _intern_text(value)
 
     @property
     def parent(self) -> Optional["Node"]:
@@ -51,6 +93,8 @@ class Node:
     @property
     def children(self) -> List["Node"]:
         """子ノードのリストを取得"""
+        if self._children is None:
+            return []
         return self._children.copy()
 
     @property
@@ -99,13 +143,37 @@ class Node:
         """
         # 既に他の親を持つ場合は、古い親から削除
         if child._parent is not None:
-            child._parent._children.remove(child)
+            child._parent._detach_child(child)
 
         # 新しい親子関係を設定
-        if child not in self._children:
+        if self._children is None:
+            self._children = [child]
+        elif child not in self._children:
             self._children.append(child)
         child._parent = self
 
+    def add_children(self, children: List["Node"]) -> None:
+        """
+        複数の子ノードをまとめて末尾に追加する
+
+        親を持たない子ノードはどのリストにも入っていないため、重複の確認をせずに追加する
+        （パーサーで作ったばかりのノードを大量に追加するとき、add_childの線形探索を避ける）。
+        既に親を持つ子ノードはadd_childと同じく古い親から削除してから追加する
+
+        Args:
+            children: 追加する子ノードのリスト
+        """
+        for child in children:
+            if child._parent is not None:
+                self.add_child(child)
+                continue
+
+            if self._children is None:
+                self._children = [child]
+            else:
+                self._children.append(child)
+            child._parent = self
+
     def remove_child(self, child: "Node") -> None:
         """
         子ノードを削除する
@@ -113,10 +181,21 @@ class Node:
         Args:
             child: 削除する子ノード
         """
-        if child in self._children:
-            self._children.remove(child)
+        if self._children is not None and child in self._children:
+            self._detach_child(child)
             child._parent = None
 
+    def _detach_child(self, child: "Node") -> None:
+        """
+        子ノードのリストから子ノードを取り除く（子がなくなればリストも破棄する）
+
+        Args:
+            child: 取り除く子ノード
+        """
+        self._children.remove(child)
+        if not self._children:
+            self._children = None
+
     def set_position(self, x: int, y: int) -> None:
         """
         ノードの位置を設定する
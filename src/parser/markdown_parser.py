@@ -3,20 +3,116 @@ MarkdownParser
 
 MarkdownテキストをNodeツリー構造に変換するパーサー
 """
-import re
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Sequence
+from functools import lru_cache
 from src.domain.node import Node
 
 
+# 見出しの最大レベル（######）
+_MAX_HEADING_LEVEL = 6
+# リスト項目の記号
+_LIST_MARKERS = ('-', '*')
+
+
+def _match_heading(line: str) -> Optional[Tuple[int, str]]:
+    """
+    行が見出し（1〜6個の#、空白、テキスト）かを判定する
+
+    正規表現を使わず、先頭の#を数えて次の文字を調べるだけで判定する
+
+    Args:
+        line: 1行分のテキスト
+
+    Returns:
+        (レベル, テキスト)、見出しでない場合はNone
+    """
+    # 先頭の#の数を数える
+    level = 0
+    length = len(line)
+    while level < length and level <= _MAX_HEADING_LEVEL and line[level] == '#':
+        level += 1
+
+    # #が1〜6個で、その後に空白と1文字以上が続く場合のみ見出し
+    if level == 0 or level > _MAX_HEADING_LEVEL or level + 1 >= length or not line[level].isspace():
+        return None
+    return level, line[level + 1:].strip()
+
+
+def _match_list_item(line: str) -> Optional[Tuple[int, str]]:
+    """
+    行がリスト項目（インデント、-または*、空白、テキスト）かを判定する
+
+    正規表現を使わず、先頭の空白を数えて記号と次の文字を調べるだけで判定する
+
+    Args:
+        line: 1行分のテキスト
+
+    Returns:
+        (インデントレベル, テキスト)、リスト項目でない場合はNone
+    """
+    # インデントの幅を数える（2スペースまたは1タブ = 1レベル）
+    length = len(line)
+    index = 0
+    width = 0
+    while index < length and line[index].isspace():
+        width += 2 if line[index] == '\t' else 1
+        index += 1
+
+    # 記号の後に空白と1文字以上が続く場合のみリスト項目
+    if index + 2 >= length or line[index] not in _LIST_MARKERS or not line[index + 1].isspace():
+        return None
+    return width // 2, line[index + 2:].strip()
+
+
+@lru_cache(maxsize=16)
+def _extract_entries(markdown_text: str) -> Tuple[Tuple[Tuple[int, str, int], ...], Tuple[Tuple[int, str, int], ...]]:
+    """
+    Markdownテキストの各行からリスト項目と見出しを1回の走査で抽出する
+
+    行の先頭文字で見出し・リスト項目・それ以外を振り分け、
+    どちらにもなり得ない行は判定せずに飛ばす。
+    エディタでは同じテキストを繰り返しパースするため（元に戻す・やり直しなど）、
+    結果は変更できないタプルにしてキャッシュする（ノードはパースのたびに作り直す）
+
+    Args:
+        markdown_text: Markdownテキスト
+
+    Returns:
+        (リスト項目のタプル, 見出しのタプル)
+        それぞれ(レベル, テキスト, 行番号)のタプルのタプル
+    """
+    # 行番号をエディタのブロック番号と合わせるため、改行文字だけで区切る
+    lines = markdown_text.split('\n')
+
+    items: List[Tuple[int, str, int]] = []
+    headings: List[Tuple[int, str, int]] = []
+
+    for line_num, line in enumerate(lines):
+        # 空行は判定するまでもなく飛ばす
+        if not line:
+            continue
+        first = line[0]
+        if first == '#':
+            # 見出しは行頭の#で始まる（インデントは許さない）
+            heading = _match_heading(line)
+            if heading is not None:
+                level, text = heading
+                headings.append((level, text, line_num))
+        elif first in _LIST_MARKERS or first.isspace():
+            # リスト項目は記号またはインデントで始まる
+            item = _match_list_item(line)
+            if item is not None:
+                indent_level, text = item
+                items.append((indent_level, text, line_num))
+
+    return tuple(items), tuple(headings)
+
+
 class MarkdownParser:
     """Markdownテキストをパースしてノードツリーを生成するクラス"""
 
     def __init__(self) -> None:
         """パーサーを初期化する"""
-        # 見出しパターン: # 見出し
-        self._heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$')
-        # リストパターン: - または * で始まる（インデント考慮）
-        self._list_pattern = re.compile(r'^(\s*)[-*]\s+(.+)$')
         # 行番号→ノードのマッピング
         self._line_to_node_map: dict[int, Node] = {}
 
@@ -36,70 +132,25 @@ class MarkdownParser:
         if not markdown_text.strip():
             return None
 
-        # リスト表記を優先的にチェック
-        items = self._extract_list_items(markdown_text)
+        # 1回の走査でリスト項目と見出しを両方集める（同じテキストならキャッシュを使う）
+        items, headings = _extract_entries(markdown_text)
+
+        # リスト表記を優先する
         if items:
             return self._build_tree_from_list(items)
 
-        # リスト表記がない場合は見出し表記をチェック
-        headings = self._extract_headings(markdown_text)
+        # リスト表記がない場合は見出し表記を使う
         if not headings:
             return None
 
         return self._build_tree(headings)
 
-    def _extract_headings(self, markdown_text: str) -> List[Tuple[int, str, int]]:
-        """
-        Markdownテキストから見出しを抽出する
-
-        Args:
-            markdown_text: Markdownテキスト
-
-        Returns:
-            (レベル, テキスト, 行番号)のタプルのリスト
-        """
-        headings: List[Tuple[int, str, int]] = []
-        lines = markdown_text.split('\n')
-
-        for line_num, line in enumerate(lines):
-            match = self._heading_pattern.match(line)
-            if match:
-                level = len(match.group(1))  # #の数
-                text = match.group(2).strip()
-                headings.append((level, text, line_num))
-
-        return headings
-
-    def _extract_list_items(self, markdown_text: str) -> List[Tuple[int, str, int]]:
-        """
-        Markdownテキストからリスト項目を抽出する
-
-        Args:
-            markdown_text: Markdownテキスト
-
-        Returns:
-            (インデントレベル, テキスト, 行番号)のタプルのリスト
-        """
-        items: List[Tuple[int, str, int]] = []
-        lines = markdown_text.split('\n')
-
-        for line_num, line in enumerate(lines):
-            match = self._list_pattern.match(line)
-            if match:
-                indent = match.group(1)
-                # インデントレベルを計算（2スペースまたは1タブ = 1レベル）
-                indent_level = len(indent.replace('\t', '  ')) // 2
-                text = match.group(2).strip()
-                items.append((indent_level, text, line_num))
-
-        return items
-
-    def _build_tree_from_list(self, items: List[Tuple[int, str, int]]) -> Optional[Node]:
+    def _build_tree_from_list(self, items: Sequence[Tuple[int, str, int]]) -> Optional[Node]:
         """
         リスト項目からノードツリーを構築する
 
         Args:
-            items: (インデントレベル, テキスト, 行番号)のタプルのリスト
+            items: (インデントレベル, テキスト, 行番号)のタプルの並び
 
         Returns:
             ルートノード
@@ -118,28 +169,8 @@ class MarkdownParser:
             root = Node(text="__virtual_root__")
             # すべての項目を仮想ルートの下に配置するため、レベルを調整
             adjusted_items = [(level - min_level, text, line_num) for level, text, line_num in items]
-            level_stack = {-1: root}  # 仮想ルートをレベル-1に配置
-
-            for level, text, line_num in adjusted_items:
-                new_node = Node(text=text)
-                # 行番号とノードをマッピング
-                self._line_to_node_map[line_num] = new_node
-
-                # 親となるノードを探す
-                parent = self._find_parent(level, level_stack)
-
-                if parent:
-                    parent.add_child(new_node)
-                else:
-                    root.add_child(new_node)
-
-                # 現在のレベル以上のレベルをスタックから削除
-                keys_to_remove = [k for k in level_stack.keys() if k >= level]
-                for k in keys_to_remove:
-                    del level_stack[k]
-
-                # 新しいノードをスタックに追加
-                level_stack[level] = new_node
+            level_stack = [(-1, root)]  # 仮想ルートをレベル-1に配置
+            self._attach_nodes(adjusted_items, root, level_stack)
 
             return root
         else:
@@ -150,38 +181,17 @@ class MarkdownParser:
             self._line_to_node_map[root_line_num] = root
 
             # スタックで現在の各レベルでの最新ノードを追跡
-            level_stack = {root_level: root}
-
-            for level, text, line_num in items[1:]:
-                new_node = Node(text=text)
-                # 行番号とノードをマッピング
-                self._line_to_node_map[line_num] = new_node
-
-                # 親となるノードを探す（現在のレベルより小さい最大のレベル）
-                parent = self._find_parent(level, level_stack)
-
-                if parent:
-                    parent.add_child(new_node)
-                else:
-                    # 親が見つからない場合はルートの子とする
-                    root.add_child(new_node)
-
-                # 現在のレベル以上のレベルをスタックから削除
-                keys_to_remove = [k for k in level_stack.keys() if k >= level]
-                for k in keys_to_remove:
-                    del level_stack[k]
-
-                # 新しいノードをスタックに追加
-                level_stack[level] = new_node
+            level_stack = [(root_level, root)]
+            self._attach_nodes(items[1:], root, level_stack)
 
             return root
 
-    def _build_tree(self, headings: List[Tuple[int, str, int]]) -> Optional[Node]:
+    def _build_tree(self, headings: Sequence[Tuple[int, str, int]]) -> Optional[Node]:
         """
         見出しリストからノードツリーを構築する
 
         Args:
-            headings: (レベル, テキスト, 行番号)のタプルのリスト
+            headings: (レベル, テキスト, 行番号)のタプルの並び
 
         Returns:
             ルートノード
@@ -200,28 +210,8 @@ class MarkdownParser:
             root = Node(text="__virtual_root__")
             # すべての見出しを仮想ルートの下に配置するため、レベルを調整
             adjusted_headings = [(level - min_level + 1, text, line_num) for level, text, line_num in headings]
-            level_stack = {0: root}  # 仮想ルートをレベル0に配置
-
-            for level, text, line_num in adjusted_headings:
-                new_node = Node(text=text)
-                # 行番号とノードをマッピング
-                self._line_to_node_map[line_num] = new_node
-
-                # 親となるノードを探す
-                parent = self._find_parent(level, level_stack)
-
-                if parent:
-                    parent.add_child(new_node)
-                else:
-                    root.add_child(new_node)
-
-                # 現在のレベル以上のレベルをスタックから削除
-                keys_to_remove = [k for k in level_stack.keys() if k >= level]
-                for k in keys_to_remove:
-                    del level_stack[k]
-
-                # 新しいノードをスタックに追加
-                level_stack[level] = new_node
+            level_stack = [(0, root)]  # 仮想ルートをレベル0に配置
+            self._attach_nodes(adjusted_headings, root, level_stack)
 
             return root
         else:
@@ -232,30 +222,8 @@ class MarkdownParser:
             self._line_to_node_map[root_line_num] = root
 
             # スタックで現在の各レベルでの最新ノードを追跡
-            # level -> node のマッピング
-            level_stack = {root_level: root}
-
-            for level, text, line_num in headings[1:]:
-                new_node = Node(text=text)
-                # 行番号とノードをマッピング
-                self._line_to_node_map[line_num] = new_node
-
-                # 親となるノードを探す（現在のレベルより小さい最大のレベル）
-                parent = self._find_parent(level, level_stack)
-
-                if parent:
-                    parent.add_child(new_node)
-                else:
-                    # 親が見つからない場合はルートの子とする
-                    root.add_child(new_node)
-
-                # 現在のレベルとそれ以下のレベルをスタックから削除
-                keys_to_remove = [k for k in level_stack.keys() if k >= level]
-                for k in keys_to_remove:
-                    del level_stack[k]
-
-                # 新しいノードをスタックに追加
-                level_stack[level] = new_node
+            level_stack = [(root_level, root)]
+            self._attach_nodes(headings[1:], root, level_stack)
 
             return root
 
@@ -286,22 +254,43 @@ class MarkdownParser:
                 return line_num
         return None
 
-    def _find_parent(self, level: int, level_stack: dict) -> Optional[Node]:
+    def _attach_nodes(self, entries: Sequence[Tuple[int, str, int]], root: Node, level_stack: List[Tuple[int, Node]]) -> None:
         """
-        指定されたレベルのノードの親を探す
+        (レベル, テキスト, 行番号)の並びからノードを作成し、親子関係をつなぐ
 
-        Args:
-            level: 検索するレベル
-            level_stack: レベルとノードのマッピング
+        各レベルの最新ノードをレベルの昇順に積んだスタックで親を探すため、
+        1行あたり（償却で）定数時間で親が決まる
 
-        Returns:
-            親ノード、見つからない場合はNone
+        Args:
+            entries: (レベル, テキスト, 行番号)のタプルの並び
+            root: 親が見つからないノードを追加するルートノード
+            level_stack: (レベル, ノード)のスタック（レベルの昇順。処理に合わせて書き換える）
         """
-        # 現在のレベルより小さいレベルを探す
-        parent_levels = [l for l in level_stack.keys() if l < level]
-        if not parent_levels:
-            return None
+        # 親ごとの子ノードのリスト（最後にまとめて追加し、1つずつの重複確認を避ける）
+        pending_children: Dict[Node, List[Node]] = {}
 
-        # 最も大きいレベル（最も近い親）を選択
-        parent_level = max(parent_levels)
-        return level_stack[parent_level]
+        for level, text, line_num in entries:
+            new_node = Node(text=text)
+            # 行番号とノードをマッピング
+            self._line_to_node_map[line_num] = new_node
+
+            # 現在のレベル以上のノードを取り除くと、末尾が親（現在のレベルより小さい最大のレベル）になる
+            while level_stack and level_stack[-1][0] >= level:
+                level_stack.pop()
+
+            if level_stack:
+                parent = level_stack[-1][1]
+            else:
+                # 親が見つからない場合はルートの子とする
+                parent = root
+            siblings = pending_children.get(parent)
+            if siblings is None:
+                pending_children[parent] = [new_node]
+            else:
+                siblings.append(new_node)
+
+            # 新しいノードをスタックに追加
+            level_stack.append((level, new_node))
+
+        for parent, children in pending_children.items():
+            parent.add_children(children)
@@ -3,10 +3,15 @@ NodeツリーからMarkdownテキストへの変換
 
 マインドマップのNodeツリーをMarkdownのリスト表記に変換する
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple, Callable
+import io
 from src.domain.node import Node
 
 
+# よく使う深さのインデント（スペース2つ x depth）を事前に作っておき、行ごとに作らずに済ませる
+_INDENTS = tuple("  " * depth for depth in range(33))
+
+
 class TreeToMarkdownConverter:
     """NodeツリーをMarkdownテキストに変換するクラス"""
 
@@ -24,34 +29,40 @@ class TreeToMarkdownConverter:
         Returns:
             Markdownテキスト（リスト形式）
         """
-        if root is None:
-            return ""
+        buffer = io.StringIO()
+        self.convert_into(root, buffer.write)
+        return buffer.getvalue()
 
-        lines: List[str] = []
+    def convert_into(self, root: Optional[Node], write: Callable[[str], None]) -> None:
+        """
+        NodeツリーをMarkdownテキストに変換し、少しずつ書き出す
+
+        行のリストを作らずに書き出すため、大きなツリーでも全行を同時にメモリに持たない
+
+        Args:
+            root: ルートノード
+            write: テキストを書き出す関数（例: ファイルやStringIOのwrite）
+        """
+        if root is None:
+            return
 
         # 仮想ルートノードの場合は、子ノードを直接depth 0で変換
         if root.text == "__virtual_root__":
-            for child in root.children:
-                self._convert_node(child, 0, lines)
+            top_nodes = root.children
         else:
-            self._convert_node(root, 0, lines)
+            top_nodes = [root]
 
-        return "\n".join(lines)
+        # 明示的なスタックで行きがけ順にたどる（深いツリーでも再帰の上限に達しない）
+        # 先頭のノードから取り出されるように逆順に積む
+        stack: List[Tuple[Node, int]] = [(node, 0) for node in reversed(top_nodes)]
+        # 改行は行と行の間にだけ入れる（末尾には付けない）
+        separator = ""
+        while stack:
+            node, depth = stack.pop()
+            # インデント（スペース2つ x depth）
+            indent = _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+            # リスト項目として書き出す
+            write(f"{separator}{indent}- {node.text}")
+            separator = "\n"
 
-    def _convert_node(self, node: Node, depth: int, lines: List[str]) -> None:
-        """
-        ノードを再帰的にMarkdown行に変換
-
-        Args:
-            node: 変換するノード
-            depth: 現在の深さ（インデントレベル）
-            lines: 出力行のリスト
-        """
-        # インデント（スペース2つ x depth）
-        indent = "  " * depth
-        # リスト項目として追加
-        lines.append(f"{indent}- {node.text}")
-
-        # 子ノードを再帰的に変換
-        for child in node.children:
-            self._convert_node(child, depth + 1, lines)
+            stack.extend((child, depth + 1) for child in reversed(node.children))
@@ -110,6 +110,7 @@ class MainWindow(QMainWindow):
             line_color=self._line_color,
             layout_direction=self._layout_direction
         )
+        self._mindmap_view.set_use_opengl(self._use_opengl)
         self._splitter.addWidget(self._mindmap_view)
 
         # 保存されたスプリッターサイズを復元、なければデフォルト（1:1）
@@ -450,6 +451,9 @@ class MainWindow(QMainWindow):
         # ペイン配置の読み込み（デフォルトは左右）
         self._pane_orientation = self._settings.value("pane_orientation", 0, type=int)
 
+        # OpenGL描画の読み込み（デフォルトはオフ）
+        self._use_opengl = self._settings.value("use_opengl", False, type=bool)
+
         # 最近開いたファイルの読み込み（テキストファイルから）
         self._load_recent_files()
 
@@ -460,6 +464,7 @@ class MainWindow(QMainWindow):
         self._settings.setValue("line_color", self._line_color.name())
         self._settings.setValue("layout_direction", self._layout_direction)
         self._settings.setValue("pane_orientation", self._pane_orientation)
+        self._settings.setValue("use_opengl", self._use_opengl)
 
     def _on_settings(self) -> None:
         """設定ダイアログを開く"""
@@ -469,6 +474,7 @@ class MainWindow(QMainWindow):
         dialog.set_line_color(self._line_color)
         dialog.set_layout_direction(self._layout_direction)
         dialog.set_pane_orientation(self._pane_orientation)
+        dialog.set_use_opengl(self._use_opengl)
 
         # 適用ボタンが押されたときに設定を適用
         dialog.settings_changed.connect(lambda: self._apply_settings_from_dialog(dialog))
@@ -490,6 +496,7 @@ class MainWindow(QMainWindow):
         new_line_color = dialog.get_line_color()
         new_layout_direction = dialog.get_layout_direction()
         new_pane_orientation = dialog.get_pane_orientation()
+        new_use_opengl = dialog.get_use_opengl()
         apply_scope = dialog.get_apply_scope()
 
         # 適用範囲に応じて設定を適用
@@ -507,6 +514,11 @@ class MainWindow(QMainWindow):
                 self._pane_orientation = new_pane_orientation
                 self._update_pane_orientation()
 
+            # 描画方法が変更された場合（使えない環境ではオフのまま）
+            if self._use_opengl != new_use_opengl:
+                if self._mindmap_view.set_use_opengl(new_use_opengl):
+                    self._use_opengl = new_use_opengl
+
             self._save_settings()
 
             # マインドマップビューのデフォルト設定を更新
@@ -3,13 +3,35 @@
 
 右ペインのマインドマップ表示エリア
 """
-from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPathItem
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QEvent, QPropertyAnimation, QEasingCurve
+from PyQt6.QtWidgets import QWidget, QGraphicsView, QGraphicsScene, QGraphicsPathItem
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QEvent, QPropertyAnimation, QEasingCurve, QTimer, QSignalBlocker, QElapsedTimer
 from PyQt6.QtGui import QPen, QBrush, QColor, QPainter, QPainterPath, QImage
 from PyQt6.QtWidgets import QPinchGesture
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Tuple, List, BinaryIO
+from itertools import accumulate
+from operator import itemgetter
+import math
+import struct
+import zlib
 from src.domain.node import Node
 from src.presentation.node_item import NodeItem
+from src.presentation.spatial import NodeQuadTree
+
+
+# PNGエクスポートで1枚のQImageに収める最大ピクセル数（これを超える場合は帯状に分割して書き出す）
+_EXPORT_MAX_IMAGE_PIXELS = 4096 * 4096
+# 分割書き出し時の1帯あたりの高さ（ピクセル）
+_EXPORT_BAND_HEIGHT = 256
+
+# 背景ブラシと既定色（全ビューで共有する。QColorは値型なので共有しても書き換わらない）
+_BG_BRUSH = QBrush(QColor(250, 250, 250))
+_DEFAULT_FONT_COLOR = QColor(0, 0, 0)
+_DEFAULT_LINE_COLOR = QColor(150, 150, 150)
+
+# ホイールズームの1段階の倍率（ズームレベルはこの累乗に丸め、キャッシュの作り直しを段階ごとに抑える）
+_ZOOM_STEP = 1.1
+# これ以上間が空いたホイール操作は別の操作とみなし、持ち越した回転量を捨てる（ミリ秒）
+_WHEEL_GESTURE_GAP_MS = 200
 
 
 class MindMapView(QGraphicsView):
@@ -39,22 +61,53 @@ class MindMapView(QGraphicsView):
         self._setup_ui()
 
         # ノードアイテムを管理
-        self._node_items: Dict[str, NodeItem] = {}
+        # キーはid(node)（各アイテムがノードを参照し続けるため再利用されない）
+        self._node_items: Dict[int, NodeItem] = {}
+        self._connection_item: Optional[QGraphicsPathItem] = None  # 全接続線をまとめた1つのパスアイテム（表示範囲内のもののみ）
+        # 接続線の形状（境界矩形, 始点x, 始点y, 第1制御点x, 第2制御点x, 終点x, 終点y）
+        self._edge_segments: List[Tuple[QRectF, float, float, float, float, float, float]] = []
+        # 配置順（行きがけ順）に並べたノードアイテム
+        self._layout_order: List[NodeItem] = []
+        # 配置順に並べた各アイテムの位置と大きさ（位置は計算後にまとめてアイテムへ反映する）
+        self._item_xs: List[float] = []
+        self._item_ys: List[float] = []
+        self._item_widths: List[float] = []
+        self._item_heights: List[float] = []
+        # 再描画時に再利用するノードアイテム（表示していたテキストごと。同じテキストのノードに優先して割り当てる）
+        self._item_pool: Dict[str, List[NodeItem]] = {}
+        self._kept_items: Dict[int, NodeItem] = {}  # 再描画後も同じノードを表示するため、シーンに残しておくアイテム
+        self._subtree_sizes: Dict[str, float] = {}  # ノードID→サブツリーの高さ（縦方向レイアウトでは幅）
+        self._items_rect = QRectF()  # 配置済みノードアイテム全体の境界矩形（シーン座標）
+        self._node_index: Optional[NodeQuadTree] = None  # ドロップ先の検索に使うノードアイテムの空間インデックス
         self._root_node: Optional[Node] = None
+        self._last_tree_sig: Optional[tuple] = None  # 前回表示したツリーの署名（変化がなければ再構築しない）
         self._selected_node_item: Optional[NodeItem] = None  # 選択中のノード
         self._focused_node_item: Optional[NodeItem] = None  # フォーカス中のノード（カーソル位置）
 
         # フォント設定
         self._font_size = font_size
-        self._font_color = font_color if font_color is not None else QColor(0, 0, 0)
-        self._line_color = line_color if line_color is not None else QColor(150, 150, 150)
+        self._font_color = font_color if font_color is not None else _DEFAULT_FONT_COLOR
+        self._line_color = line_color if line_color is not None else _DEFAULT_LINE_COLOR
+        self._line_pen = self._create_line_pen(self._line_color)  # 接続線のペン（線の色が変わったときだけ作り直す）
         self._layout_direction = layout_direction  # 0: 右のみ, 1: 左右交互
+        self._use_opengl = False  # OpenGLのビューポートで描画しているか
 
         # ズームレベル管理
         self._zoom_level = 1.0
         self._zoom_min = 0.1
         self._zoom_max = 3.0
 
+        # ホイールズームはイベントごとではなく1フレーム（16ms）ごとにまとめて適用する
+        self._pending_wheel_delta = 0
+        self._wheel_clock = QElapsedTimer()  # 最後にズームしたホイールイベントからの経過時間
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_wheel_zoom)
+
+        # ピンチズームは倍率の変化が1%以上たまってから適用する（まだ適用していない倍率）
+        self._pending_pinch_scale = 1.0
+
         # パン（移動）管理
         self._is_panning = False
         self._pan_start_pos = None
@@ -68,14 +121,32 @@ class MindMapView(QGraphicsView):
         self._scroll_animation_v.setDuration(500)  # 500ミリ秒
         self._scroll_animation_v.setEasingCurve(QEasingCurve.Type.InOutCubic)
 
+        # 表示範囲が変わったときの接続線の作り直し（スクロールやリサイズ中は1フレームにまとめる）
+        self._connection_update_timer = QTimer(self)
+        self._connection_update_timer.setSingleShot(True)
+        self._connection_update_timer.setInterval(16)
+        self._connection_update_timer.timeout.connect(self._update_connection_items)
+        for scroll_bar in (self.horizontalScrollBar(), self.verticalScrollBar()):
+            scroll_bar.valueChanged.connect(self._schedule_connection_update)
+            scroll_bar.rangeChanged.connect(self._schedule_connection_update)
+
     def _setup_ui(self) -> None:
         """UIをセットアップする"""
+        # シーンは表示のたびに一括で作り直すため、BSPインデックスの維持は不要
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
         # 背景色
-        self.setBackgroundBrush(QBrush(QColor(250, 250, 250)))
+        self.setBackgroundBrush(_BG_BRUSH)
 
         # アンチエイリアス
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        # 再描画範囲はQtに選ばせ、アイテムごとのペインタ状態の保存・復元と
+        # アンチエイリアス用の再描画範囲の拡張を省く（各アイテムは境界矩形の内側で自前のペンを設定して描画する）
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+
         # ドラッグモードは無効化（ノードのドラッグを優先）
         self.setDragMode(QGraphicsView.DragMode.NoDrag)
 
@@ -93,16 +164,114 @@ class MindMapView(QGraphicsView):
         Args:
             root: ルートノード
         """
-        # シーンをクリア
-        self._scene.clear()
-        self._node_items.clear()
-        self._selected_node_item = None  # 選択状態もクリア
-        self._focused_node_item = None  # フォーカス状態もクリア
-        self._root_node = root
+        # 同じルートで、ツリーも表示設定も前回から変わっていなければ作り直さない
+        # （エディタからは毎回新しいルートが渡されるため、署名は同じルートのときだけ計算する）
+        tree_sig = None
+        if root is not None and root is self._root_node:
+            tree_sig = self._tree_sig(root)
+            if tree_sig == self._last_tree_sig:
+                return
+        self._last_tree_sig = tree_sig
 
-        if root is None:
-            return
+        # 一括で作り直す間はビューの再描画を止め、最後に1回だけ描き直す
+        self.setUpdatesEnabled(False)
+        try:
+            # 一括で作り直す間はシーンのシグナルを止める
+            with QSignalBlocker(self._scene):
+                # 新しいツリーにも含まれるノードのアイテムはそのまま位置だけ更新し、
+                # それ以外は別のノードに再利用する（シグナル接続は維持され、シーンにも残したままにする）
+                node_keys = set()
+                stack = [root] if root is not None else []
+                while stack:
+                    node = stack.pop()
+                    node_keys.add(id(node))
+                    stack.extend(node.children)
+
+                for node_key, node_item in self._node_items.items():
+                    if node_key in node_keys:
+                        self._kept_items[node_key] = node_item
+                    else:
+                        self._item_pool.setdefault(node_item.node.text, []).append(node_item)
+
+                self._node_items.clear()
+                self._layout_order.clear()
+                self._edge_segments.clear()
+                self._item_xs.clear()
+                self._item_ys.clear()
+                self._item_widths.clear()
+                self._item_heights.clear()
+                self._subtree_sizes.clear()  # サブツリーの大きさは表示ごとに1回だけ計算し直す
+                self._selected_node_item = None  # 選択状態もクリア
+                self._focused_node_item = None  # フォーカス状態もクリア
+                self._root_node = root
+                self._items_rect = QRectF()
+
+                if root is None:
+                    # シーンをクリア
+                    self._release_item_pool()
+                    self._scene.clear()
+                    self._connection_item = None
+                    self._node_index = None
+                    return
+
+                self._layout_tree(root)
+
+                # 再利用されなかったアイテムを解放
+                for node_item in self._kept_items.values():
+                    self._item_pool.setdefault(node_item.node.text, []).append(node_item)
+                self._kept_items.clear()
+                self._release_item_pool()
+
+                # 接続線を描画（形状は配置中に計算済み）
+                self._update_connection_items()
+
+            # シーンのサイズを調整（余白を追加）
+            # 配置時に集計した境界矩形を使い、itemsBoundingRectによる全アイテムの走査を省く
+            items_rect = self._items_rect
+            margin = 100  # 左右上下の余白
+            self._scene.setSceneRect(
+                items_rect.x() - margin,
+                items_rect.y() - margin,
+                items_rect.width() + margin * 2,
+                items_rect.height() + margin * 2
+            )
+        finally:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
+    def _tree_sig(self, root: Node) -> tuple:
+        """
+        ツリーの構造と表示内容から署名を計算する
+
+        ノードID・テキスト・子の並び・フォント設定・手動配置に加え、
+        レイアウトに影響するビューのフォントサイズとレイアウト方向を含める
+
+        Args:
+            root: ルートノード
 
+        Returns:
+            署名（ハッシュ値の衝突で作り直しを飛ばさないよう、ハッシュせずに内容のタプルで比較する）
+        """
+        entries = [(self._font_size, self._layout_direction)]
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            children = node.children
+            entries.append((
+                node.id, node.text, tuple(child.id for child in children),
+                node.font_size, node.font_color,
+                node.manual_position, node.position
+            ))
+            stack.extend(children)
+        return tuple(entries)
+
+    def _layout_tree(self, root: Node) -> None:
+        """
+        レイアウト方向に応じてノードアイテムを作成・配置する
+
+        Args:
+            root: ルートノード
+        """
         # 仮想ルートノードの場合は、子ノードたちを最上位として並べて表示
         if root.text == "__virtual_root__":
             if self._layout_direction == 0:
@@ -112,7 +281,8 @@ class MindMapView(QGraphicsView):
                 vertical_spacing = 40
 
                 # 各トップレベルノードの高さを計算
-                child_heights = [self._calculate_subtree_height(child, vertical_spacing) for child in root.children]
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 60, vertical_spacing)
+                child_heights = [self._subtree_sizes[child.id] for child in root.children]
                 total_height = sum(child_heights) + vertical_spacing * (len(root.children) - 1)
 
                 current_y = start_y
@@ -126,26 +296,11 @@ class MindMapView(QGraphicsView):
                 vertical_spacing = 80  # 左右で重ならないように間隔を広げる
 
                 # 各トップレベルノードの高さを計算
-                child_heights = [self._calculate_subtree_height(child, vertical_spacing) for child in root.children]
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 60, vertical_spacing)
+                child_heights = [self._subtree_sizes[child.id] for child in root.children]
 
                 # 左側と右側に分ける（合計高さができるだけ均等になるように）
-                left_children = []
-                right_children = []
-                left_total = 0
-                right_total = 0
-
-                # 高さが大きい順にソート
-                children_with_heights = [(root.children[i], child_heights[i]) for i in range(len(root.children))]
-                children_with_heights.sort(key=lambda x: x[1], reverse=True)
-
-                # 貪欲法で左右に振り分け
-                for child, height in children_with_heights:
-                    if left_total <= right_total:
-                        left_children.append((child, height))
-                        left_total += height
-                    else:
-                        right_children.append((child, height))
-                        right_total += height
+                left_children, right_children = self._balanced_split(root.children, child_heights)
 
                 # 左右の合計高さを計算（スペース込み）
                 left_total_height = sum(h for _, h in left_children) + vertical_spacing * (len(left_children) - 1) if left_children else 0
@@ -177,7 +332,8 @@ class MindMapView(QGraphicsView):
                 horizontal_spacing = 80
 
                 # 各トップレベルノードの幅を計算
-                child_widths = [self._calculate_subtree_width(child, horizontal_spacing) for child in root.children]
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 200, horizontal_spacing)
+                child_widths = [self._subtree_sizes[child.id] for child in root.children]
                 total_width = sum(child_widths) + horizontal_spacing * (len(root.children) - 1)
 
                 current_x = start_x
@@ -191,26 +347,11 @@ class MindMapView(QGraphicsView):
                 horizontal_spacing = 120  # 上下で重ならないように間隔を広げる
 
                 # 各トップレベルノードの幅を計算
-                child_widths = [self._calculate_subtree_width(child, horizontal_spacing) for child in root.children]
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 200, horizontal_spacing)
+                child_widths = [self._subtree_sizes[child.id] for child in root.children]
 
                 # 上側と下側に分ける（合計幅ができるだけ均等になるように）
-                top_children = []
-                bottom_children = []
-                top_total = 0
-                bottom_total = 0
-
-                # 幅が大きい順にソート
-                children_with_widths = [(root.children[i], child_widths[i]) for i in range(len(root.children))]
-                children_with_widths.sort(key=lambda x: x[1], reverse=True)
-
-                # 貪欲法で上下に振り分け
-                for child, width in children_with_widths:
-                    if top_total <= bottom_total:
-                        top_children.append((child, width))
-                        top_total += width
-                    else:
-                        bottom_children.append((child, width))
-                        bottom_total += width
+                top_children, bottom_children = self._balanced_split(root.children, child_widths)
 
                 # 上下の合計幅を計算（スペース込み）
                 top_total_width = sum(w for _, w in top_children) + horizontal_spacing * (len(top_children) - 1) if top_children else 0
@@ -241,86 +382,113 @@ class MindMapView(QGraphicsView):
                 vertical_spacing = 40
                 start_x = 100
                 start_y = 300
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 60, vertical_spacing)
                 self._draw_node_with_direction(root, start_x, start_y, 0, direction=1, vertical_spacing=vertical_spacing)
             elif self._layout_direction == 1:
                 # 左右交互：ルートを中央に配置
                 vertical_spacing = 40
                 start_x = 500
                 start_y = 300
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 60, vertical_spacing)
                 self._draw_node_with_direction(root, start_x, start_y, 0, direction=0, vertical_spacing=vertical_spacing)
             elif self._layout_direction == 2:
                 # 下のみ
                 horizontal_spacing = 80
                 start_x = 400
                 start_y = 100
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 200, horizontal_spacing)
                 self._draw_node_vertical(root, start_x, start_y, 0, direction=1, horizontal_spacing=horizontal_spacing)
             else:
                 # 上下交互：ルートを中央に配置
                 horizontal_spacing = 80
                 start_x = 400
                 start_y = 300
+                self._subtree_sizes = self._calculate_subtree_sizes(root, 200, horizontal_spacing)
                 self._draw_node_vertical(root, start_x, start_y, 0, direction=0, horizontal_spacing=horizontal_spacing)
 
-        # 接続線を描画
-        self._draw_connections()
-
-        # シーンのサイズを調整（余白を追加）
-        items_rect = self._scene.itemsBoundingRect()
-        margin = 100  # 左右上下の余白
-        self._scene.setSceneRect(
-            items_rect.x() - margin,
-            items_rect.y() - margin,
-            items_rect.width() + margin * 2,
-            items_rect.height() + margin * 2
-        )
+        # 計算した位置をまとめてアイテムに反映し、ドロップ先の検索用に空間インデックスへ登録する
+        self._node_index = NodeQuadTree(self._items_rect)
+        for node_item, node_x, node_y in zip(self._layout_order, self._item_xs, self._item_ys):
+            node_item.setPos(node_x, node_y)
+            self._node_index.insert(node_item.boundingRect().translated(node_x, node_y), node_item)
+            node_item.set_spatial_index(self._node_index)
 
-    def _calculate_subtree_height(self, node: Node, vertical_spacing: float = 40) -> float:
+    def _balanced_split(self, children: List[Node], sizes: List[float]) -> Tuple[List[Tuple[Node, float]], List[Tuple[Node, float]]]:
         """
-        サブツリー全体の高さを計算する
+        子ノードを合計の大きさができるだけ均等になるように2つに振り分ける
+
+        大きい順に、その時点で合計が小さい方（同じなら1つ目）へ入れる貪欲法
 
         Args:
-            node: ノード
-            vertical_spacing: 兄弟ノード間の垂直間隔
+            children: 子ノードのリスト
+            sizes: 各子ノードのサブツリーの大きさ（childrenと同じ順）
 
         Returns:
-            サブツリーの高さ
+            (1つ目のグループ, 2つ目のグループ)。各要素は(子ノード, 大きさ)
         """
-        if not node.children:
-            return 60  # 単一ノードの高さ（テキスト + マージン）
-
-        # 各子のサブツリー高さを計算
-        child_heights = [self._calculate_subtree_height(child, vertical_spacing) for child in node.children]
-
-        # 子ノード間の間隔を含めた合計高さ
-        total_height = sum(child_heights) + vertical_spacing * (len(node.children) - 1)
+        first: List[Tuple[Node, float]] = []
+        second: List[Tuple[Node, float]] = []
+        first_total = 0
+        second_total = 0
+
+        # 大きい順に並べて貪欲法で振り分け
+        for child, size in sorted(zip(children, sizes), key=itemgetter(1), reverse=True):
+            if first_total <= second_total:
+                first.append((child, size))
+                first_total += size
+            else:
+                second.append((child, size))
+                second_total += size
 
-        return max(total_height, 60)
+        return first, second
 
-    def _calculate_subtree_width(self, node: Node, horizontal_spacing: float = 80) -> float:
+    def _calculate_subtree_sizes(self, root: Node, leaf_size: float, spacing: float) -> Dict[str, float]:
         """
-        サブツリー全体の幅を計算する（縦方向レイアウト用）
+        全ノードのサブツリーの大きさ（高さまたは幅）をまとめて計算する
+
+        ツリーを一度だけ平坦化し、葉から親へ向かって1回のループで集計する（再帰なし）
 
         Args:
-            node: ノード
-            horizontal_spacing: 兄弟ノード間の水平間隔
+            root: ルートノード
+            leaf_size: 子を持たないノードの大きさ（高さなら60、幅なら200）
+            spacing: 兄弟ノード間の間隔
 
         Returns:
-            サブツリーの幅
+            ノードID→サブツリーの大きさ
         """
-        if not node.children:
-            return 200  # 単一ノードの幅（テキスト幅の概算 + マージン）
-
-        # 各子のサブツリー幅を計算
-        child_widths = [self._calculate_subtree_width(child, horizontal_spacing) for child in node.children]
-
-        # 子ノード間の間隔を含めた合計幅
-        total_width = sum(child_widths) + horizontal_spacing * (len(node.children) - 1)
-
-        return max(total_width, 200)
-
-    def _draw_node_with_direction(self, node: Node, x: float, y: float, depth: int, direction: int, vertical_spacing: float = 40) -> float:
+        # 幅優先でツリーを平坦化（各ノードの親のインデックスを記録）
+        order: List[Node] = [root]
+        parent_indices: List[int] = [-1]
+        i = 0
+        while i < len(order):
+            for child in order[i].children:
+                order.append(child)
+                parent_indices.append(i)
+            i += 1
+
+        count = len(order)
+        sizes = [0.0] * count
+        # 子の大きさに間隔を1つずつ足して集計し、最後に余分な1つ分を引く（子の数を数えずに済む）
+        child_size_sums = [0.0] * count
+
+        # 幅優先順の逆（葉が先）に走査して、子の大きさを親へ足し込む
+        # 葉は合計が0なので、max(-spacing, leaf_size)によりleaf_sizeになる
+        for i in range(count - 1, -1, -1):
+            size = max(child_size_sums[i] - spacing, leaf_size)
+            sizes[i] = size
+
+            parent_index = parent_indices[i]
+            if parent_index >= 0:
+                child_size_sums[parent_index] += size + spacing
+
+        return {node.id: size for node, size in zip(order, sizes)}
+
+    def _draw_node_with_direction(self, node: Node, x: float, y: float, depth: int, direction: int, vertical_spacing: float = 40) -> None:
         """
-        ノードとその子孫を指定方向に再帰的に描画する
+        ノードとその子孫を指定方向に描画する
+
+        明示的なスタックで深さ優先に配置する（再帰なし）。
+        子ノードのY座標は、兄弟のサブツリーの高さの累積和から求める
 
         Args:
             node: 描画するノード
@@ -329,78 +497,88 @@ class MindMapView(QGraphicsView):
             depth: 階層の深さ
             direction: 描画方向（1=右、-1=左、0=ルート（子を左右に振り分け））
             vertical_spacing: 兄弟ノード間の垂直間隔
-
-        Returns:
-            このサブツリーが占める高さ
         """
-        # NodeItemを作成
-        node_item = NodeItem(node, depth, self._font_size, self._font_color)
-
-        # 手動配置されたノードの場合は保存された位置を使用
-        if node.manual_position:
-            pos = node.position
-            node_x = pos[0]  # 子ノードの配置計算のためにnode_xを設定
-            node_item.setPos(pos[0], pos[1])
-        else:
-            # direction=-1（左）の場合は、xからノード幅を引いた位置に配置
-            if direction == -1:
-                node_x = x - node_item.boundingRect().width()
-            else:
-                node_x = x
-
-            node_item.setPos(node_x, y - node_item.boundingRect().height() / 2)
-
-        self._scene.addItem(node_item)
-        self._node_items[node.id] = node_item
-
-        # イベントを接続
-        node_item.node_dropped.connect(self._on_node_dropped)
-        node_item.node_selected.connect(self._on_node_selected)
-
-        # 子ノードを描画
-        if not node.children:
-            return 50  # 単一ノードの高さ
-
         # 子ノードの配置
         horizontal_spacing = 120  # 横方向の間隔（親から子への距離）
 
-        # 全ての子ノードのサブツリー高さを計算
-        child_heights = [self._calculate_subtree_height(child, vertical_spacing) for child in node.children]
-        total_height = sum(child_heights) + vertical_spacing * (len(node.children) - 1)
+        # 起点ノードの親は描画されないため、親の位置は-1とする
+        stack: List[Tuple[Node, float, float, int, int, int]] = [(node, x, y, depth, direction, -1)]
+        while stack:
+            node, x, y, depth, direction, parent_index = stack.pop()
+
+            # NodeItemを作成（プールにあれば再利用）
+            node_item = self._acquire_node_item(node, depth)
+            # 境界矩形はフォント計測を伴うため1回だけ取得する
+            item_rect = node_item.boundingRect()
+            node_width = item_rect.width()
+            node_height = item_rect.height()
+
+            # 手動配置されたノードの場合は保存された位置を使用
+            if node.manual_position:
+                node_x, node_y = node.position  # 子ノードの配置計算のためにnode_xを設定
+            else:
+                # direction=-1（左）の場合は、xからノード幅を引いた位置に配置
+                if direction == -1:
+                    node_x = x - node_width
+                else:
+                    node_x = x
+
+                node_y = y - node_height / 2
+
+            if node_item.scene() is None:
+                self._scene.addItem(node_item)
+            self._node_items[id(node)] = node_item
+            item_index = len(self._layout_order)
+            self._layout_order.append(node_item)
+            self._item_xs.append(node_x)
+            self._item_ys.append(node_y)
+            self._item_widths.append(node_width)
+            self._item_heights.append(node_height)
+            self._items_rect = self._items_rect.united(item_rect.translated(node_x, node_y))
+            if parent_index >= 0:
+                self._add_edge_segment(parent_index, item_index)
+
+            children = node.children
+            if not children:
+                continue
 
-        # 子ノードの開始Y座標（中央揃え）
-        current_y = y - total_height / 2
+            # 全ての子ノードのサブツリー高さと、子ノード間の間隔を含めた合計
+            child_heights = [self._subtree_sizes[child.id] for child in children]
+            total_height = sum(child_heights) + vertical_spacing * (len(children) - 1)
+
+            # 子ノードの開始Y座標（中央揃え）と、各子の上端までのオフセット（累積和）
+            top_y = y - total_height / 2
+            offsets = accumulate((height + vertical_spacing for height in child_heights[:-1]), initial=0.0)
+
+            placements = []
+            for i, (child, child_height, offset) in enumerate(zip(children, child_heights, offsets)):
+                if direction == 0:
+                    # ルートノード：子を左右交互に配置
+                    child_direction = 1 if i % 2 == 0 else -1
+                elif direction == 1:
+                    # 右方向：通常通り右に配置
+                    child_direction = 1
+                else:
+                    # 左方向：左に配置
+                    child_direction = -1
 
-        for i, child in enumerate(node.children):
-            if direction == 0:
-                # ルートノード：子を左右交互に配置
-                child_direction = 1 if i % 2 == 0 else -1
                 if child_direction == 1:
-                    child_x = node_x + node_item.boundingRect().width() + horizontal_spacing
+                    child_x = node_x + node_width + horizontal_spacing
                 else:
                     child_x = node_x - horizontal_spacing
-            elif direction == 1:
-                # 右方向：通常通り右に配置
-                child_direction = 1
-                child_x = node_x + node_item.boundingRect().width() + horizontal_spacing
-            else:
-                # 左方向：左に配置
-                child_direction = -1
-                child_x = node_x - horizontal_spacing
-
-            child_center_y = current_y + child_heights[i] / 2
 
-            # 子ノードを再帰的に描画
-            self._draw_node_with_direction(child, child_x, child_center_y, depth + 1, child_direction, vertical_spacing)
+                child_center_y = top_y + offset + child_height / 2
+                placements.append((child, child_x, child_center_y, depth + 1, child_direction, item_index))
 
-            # 次の子ノードのY座標
-            current_y += child_heights[i] + vertical_spacing
+            # 先頭の子から処理されるように逆順で積む
+            stack.extend(reversed(placements))
 
-        return total_height
-
-    def _draw_node_vertical(self, node: Node, x: float, y: float, depth: int, direction: int, horizontal_spacing: float = 80) -> float:
+    def _draw_node_vertical(self, node: Node, x: float, y: float, depth: int, direction: int, horizontal_spacing: float = 80) -> None:
         """
-        ノードとその子孫を上下方向に再帰的に描画する
+        ノードとその子孫を上下方向に描画する
+
+        明示的なスタックで深さ優先に配置する（再帰なし）。
+        子ノードのX座標は、兄弟のサブツリーの幅の累積和から求める
 
         Args:
             node: 描画するノード
@@ -409,144 +587,272 @@ class MindMapView(QGraphicsView):
             depth: 階層の深さ
             direction: 描画方向（1=下、-1=上、0=ルート（子を上下に振り分け））
             horizontal_spacing: 兄弟ノード間の水平間隔
+        """
+        # 子ノードの配置
+        vertical_spacing = 80  # 縦方向の間隔（親から子への距離）
 
-        Returns:
-            このサブツリーが占める幅
+        # 起点ノードの親は描画されないため、親の位置は-1とする
+        stack: List[Tuple[Node, float, float, int, int, int]] = [(node, x, y, depth, direction, -1)]
+        while stack:
+            node, x, y, depth, direction, parent_index = stack.pop()
+
+            # NodeItemを作成（プールにあれば再利用）
+            node_item = self._acquire_node_item(node, depth)
+            # 境界矩形はフォント計測を伴うため1回だけ取得する
+            item_rect = node_item.boundingRect()
+            node_width = item_rect.width()
+            node_height = item_rect.height()
+
+            # 手動配置されたノードの場合は保存された位置を使用
+            if node.manual_position:
+                node_x, node_y = node.position  # 子ノードの配置計算のためにnode_x, node_yを設定
+            else:
+                # ノードを配置（x座標を中心に配置）
+                node_x = x - node_width / 2
+
+                # direction=-1（上）の場合は、yからノード高さを引いた位置に配置
+                if direction == -1:
+                    node_y = y - node_height
+                else:
+                    node_y = y
+
+
+            if node_item.scene() is None:
+                self._scene.addItem(node_item)
+            self._node_items[id(node)] = node_item
+            item_index = len(self._layout_order)
+            self._layout_order.append(node_item)
+            self._item_xs.append(node_x)
+            self._item_ys.append(node_y)
+            self._item_widths.append(node_width)
+            self._item_heights.append(node_height)
+            self._items_rect = self._items_rect.united(item_rect.translated(node_x, node_y))
+            if parent_index >= 0:
+                self._add_edge_segment(parent_index, item_index)
+
+            children = node.children
+            if not children:
+                continue
+
+            # 全ての子ノードのサブツリー幅と、子ノード間の間隔を含めた合計
+            child_widths = [self._subtree_sizes[child.id] for child in children]
+            total_width = sum(child_widths) + horizontal_spacing * (len(children) - 1)
+
+            # 子ノードの開始X座標（中央揃え）と、各子の左端までのオフセット（累積和）
+            left_x = x - total_width / 2
+            offsets = accumulate((width + horizontal_spacing for width in child_widths[:-1]), initial=0.0)
+
+            placements = []
+            for i, (child, child_width, offset) in enumerate(zip(children, child_widths, offsets)):
+                if direction == 0:
+                    # ルートノード：子を上下交互に配置
+                    child_direction = 1 if i % 2 == 0 else -1
+                elif direction == 1:
+                    # 下方向：通常通り下に配置
+                    child_direction = 1
+                else:
+                    # 上方向：上に配置
+                    child_direction = -1
+
+                if child_direction == 1:
+                    child_y = node_y + node_height + vertical_spacing
+                else:
+                    child_y = node_y - vertical_spacing
+
+                child_center_x = left_x + offset + child_width / 2
+                placements.append((child, child_center_x, child_y, depth + 1, child_direction, item_index))
+
+            # 先頭の子から処理されるように逆順で積む
+            stack.extend(reversed(placements))
+
+    def _acquire_node_item(self, node: Node, depth: int) -> NodeItem:
         """
-        # NodeItemを作成
-        node_item = NodeItem(node, depth, self._font_size, self._font_color)
+        ノードアイテムを取得する
 
-        # 手動配置されたノードの場合は保存された位置を使用
-        if node.manual_position:
-            pos = node.position
-            node_x = pos[0]  # 子ノードの配置計算のためにnode_xを設定
-            node_y = pos[1]  # 子ノードの配置計算のためにnode_yを設定
-            node_item.setPos(pos[0], pos[1])
-        else:
-            # ノードを配置（x座標を中心に配置）
-            node_x = x - node_item.boundingRect().width() / 2
+        前回も同じノードを表示していたアイテムがあればそれを使う。
+        なければプールに余っているアイテム（同じテキストを表示していたものを優先）を割り当て直して使い、
+        それもなければ新規作成してイベントを接続する。
+        Markdownを解析し直すとノードはすべて新しくなるが、テキストが同じアイテムを割り当てれば
+        テキストのレイアウトをし直さずに済み、実際に変わったノードだけが作り直される
 
-            # direction=-1（上）の場合は、yからノード高さを引いた位置に配置
-            if direction == -1:
-                node_y = y - node_item.boundingRect().height()
-            else:
-                node_y = y
+        Args:
+            node: 表示するノード
+            depth: 階層の深さ
 
-            node_item.setPos(node_x, node_y)
+        Returns:
+            ノードアイテム
+        """
+        node_item = self._kept_items.pop(id(node), None)
+        if node_item is not None:
+            node_item.reset(node, depth, self._font_size, self._font_color)
+            return node_item
+
+        if self._item_pool:
+            text = node.text
+            if text not in self._item_pool:
+                text = next(iter(self._item_pool))
+            pooled_items = self._item_pool[text]
+            node_item = pooled_items.pop()
+            if not pooled_items:
+                del self._item_pool[text]
+            node_item.reset(node, depth, self._font_size, self._font_color)
+            return node_item
 
-        self._scene.addItem(node_item)
-        self._node_items[node.id] = node_item
+        node_item = NodeItem(node, depth, self._font_size, self._font_color)
 
         # イベントを接続
         node_item.node_dropped.connect(self._on_node_dropped)
         node_item.node_selected.connect(self._on_node_selected)
+        return node_item
+
+    def _release_item_pool(self) -> None:
+        """再利用されなかったノードアイテムをシーンから外し、イベント接続を解除して解放する"""
+        for pooled_items in self._item_pool.values():
+            for node_item in pooled_items:
+                self._scene.removeItem(node_item)
+                node_item.node_dropped.disconnect()
+                node_item.node_selected.disconnect()
+        self._item_pool.clear()
+
+    def _add_edge_segment(self, parent_index: int, child_index: int) -> None:
+        """
+        親子間の接続線の形状を計算して記録する
 
-        # 子ノードを描画
-        if not node.children:
-            return 200  # 単一ノードの幅
-
-        # 子ノードの配置
-        vertical_spacing = 80  # 縦方向の間隔（親から子への距離）
-
-        # 全ての子ノードのサブツリー幅を計算
-        child_widths = [self._calculate_subtree_width(child, horizontal_spacing) for child in node.children]
-        total_width = sum(child_widths) + horizontal_spacing * (len(node.children) - 1)
+        配置中に、親と子の位置・大きさが記録された直後に呼ぶ
 
-        # 子ノードの開始X座標（中央揃え）
-        current_x = x - total_width / 2
+        Args:
+            parent_index: 親アイテムの配置順の位置
+            child_index: 子アイテムの配置順の位置
+        """
+        # 親と子の位置と大きさを取得
+        parent_x = self._item_xs[parent_index]
+        parent_y = self._item_ys[parent_index]
+        parent_width = self._item_widths[parent_index]
+        parent_height = self._item_heights[parent_index]
+        child_x = self._item_xs[child_index]
+        child_y = self._item_ys[child_index]
+        child_width = self._item_widths[child_index]
+        child_height = self._item_heights[child_index]
+
+        # 親と子の中心座標を計算
+        parent_center_x = parent_x + parent_width / 2
+        parent_center_y = parent_y + parent_height / 2
+        child_center_x = child_x + child_width / 2
+        child_center_y = child_y + child_height / 2
+
+        # 常に左右方向（水平方向）の接続を使用
+        if child_center_x > parent_center_x:
+            # 子が右側：親ノードの右端と子ノードの左端を接続
+            start_x = parent_x + parent_width + 5
+            start_y = parent_y + parent_height / 2
+            end_x = child_x - 5
+            end_y = child_y + child_height / 2
+        else:
+            # 子が左側：親ノードの左端と子ノードの右端を接続
+            start_x = parent_x - 5
+            start_y = parent_y + parent_height / 2
+            end_x = child_x + child_width + 5
+            end_y = child_y + child_height / 2
+
+        # ベジェ曲線の制御点
+        control_offset = abs(end_x - start_x) * 0.5
+        if child_center_x > parent_center_x:
+            # 右方向
+            control1_x = start_x + control_offset
+            control2_x = end_x - control_offset
+        else:
+            # 左方向
+            control1_x = start_x - control_offset
+            control2_x = end_x + control_offset
 
-        for i, child in enumerate(node.children):
-            if direction == 0:
-                # ルートノード：子を上下交互に配置
-                child_direction = 1 if i % 2 == 0 else -1
-                if child_direction == 1:
-                    child_y = node_y + node_item.boundingRect().height() + vertical_spacing
-                else:
-                    child_y = node_y - vertical_spacing
-            elif direction == 1:
-                # 下方向：通常通り下に配置
-                child_direction = 1
-                child_y = node_y + node_item.boundingRect().height() + vertical_spacing
-            else:
-                # 上方向：上に配置
-                child_direction = -1
-                child_y = node_y - vertical_spacing
+        # 曲線は始点・終点・制御点を囲む矩形に収まる（線幅の分だけ広げる）
+        edge_rect = QRectF(
+            QPointF(min(start_x, end_x, control1_x, control2_x), min(start_y, end_y)),
+            QPointF(max(start_x, end_x, control1_x, control2_x), max(start_y, end_y))
+        ).adjusted(-1, -1, 1, 1)
+        self._items_rect = self._items_rect.united(edge_rect)
 
-            child_center_x = current_x + child_widths[i] / 2
+        self._edge_segments.append((edge_rect, start_x, start_y, control1_x, control2_x, end_x, end_y))
 
-            # 子ノードを再帰的に描画
-            self._draw_node_vertical(child, child_center_x, child_y, depth + 1, child_direction, horizontal_spacing)
+    def _update_connection_items(self, cull: bool = True) -> None:
+        """
+        接続線のパスを作り直す
 
-            # 次の子ノードのX座標
-            current_x += child_widths[i] + horizontal_spacing
+        全ての接続線を1つのパスにまとめ、1つのパスアイテムとして描画する
 
-        return total_width
+        Args:
+            cull: Trueの場合、表示範囲（と周囲の余白）に掛からない接続線はパスに含めない
+        """
+        visible_rect = self._visible_scene_rect()
 
-    def _draw_connections(self) -> None:
-        """全ノード間の接続線を描画する"""
-        for node_id, node_item in self._node_items.items():
-            node = node_item.node
-            if node.parent is None:
+        # ベジェ曲線で接続（moveToで区切るため、各接続線は別々の線として描かれる）
+        path = QPainterPath()
+        for edge_rect, start_x, start_y, control1_x, control2_x, end_x, end_y in self._edge_segments:
+            if cull and not visible_rect.intersects(edge_rect):
                 continue
 
-            # 親ノードのアイテムを取得
-            parent_item = self._node_items.get(node.parent.id)
-            if parent_item is None:
+            path.moveTo(start_x, start_y)
+            # 親と子の高さがほぼ同じなら曲線も直線と見分けがつかないので、直線で済ませる
+            if abs(end_y - start_y) < 1.0:
+                path.lineTo(end_x, end_y)
                 continue
+            path.cubicTo(
+                control1_x, start_y,  # 第1制御点
+                control2_x, end_y,    # 第2制御点
+                end_x, end_y          # 終点
+            )
 
-            # 親と子の位置を取得
-            parent_pos = parent_item.scenePos()
-            parent_rect = parent_item.boundingRect()
-            child_pos = node_item.scenePos()
-            child_rect = node_item.boundingRect()
-
-            # 親と子の中心座標を計算
-            parent_center_x = parent_pos.x() + parent_rect.width() / 2
-            parent_center_y = parent_pos.y() + parent_rect.height() / 2
-            child_center_x = child_pos.x() + child_rect.width() / 2
-            child_center_y = child_pos.y() + child_rect.height() / 2
-
-            # 常に左右方向（水平方向）の接続を使用
-            if child_center_x > parent_center_x:
-                # 子が右側：親ノードの右端と子ノードの左端を接続
-                start_x = parent_pos.x() + parent_rect.width() + 5
-                start_y = parent_pos.y() + parent_rect.height() / 2
-                end_x = child_pos.x() - 5
-                end_y = child_pos.y() + child_rect.height() / 2
-            else:
-                # 子が左側：親ノードの左端と子ノードの右端を接続
-                start_x = parent_pos.x() - 5
-                start_y = parent_pos.y() + parent_rect.height() / 2
-                end_x = child_pos.x() + child_rect.width() + 5
-                end_y = child_pos.y() + child_rect.height() / 2
-
-            # ベジェ曲線で接続
-            path = QPainterPath()
-            path.moveTo(start_x, start_y)
+        if self._connection_item is not None:
+            self._connection_item.setPath(path)
+            return
 
-            control_offset = abs(end_x - start_x) * 0.5
-            if child_center_x > parent_center_x:
-                # 右方向
-                path.cubicTo(
-                    start_x + control_offset, start_y,  # 第1制御点
-                    end_x - control_offset, end_y,      # 第2制御点
-                    end_x, end_y                        # 終点
-                )
-            else:
-                # 左方向
-                path.cubicTo(
-                    start_x - control_offset, start_y,  # 第1制御点
-                    end_x + control_offset, end_y,      # 第2制御点
-                    end_x, end_y                        # 終点
-                )
+        # パスを描画
+        self._connection_item = QGraphicsPathItem(path)
+        self._connection_item.setPen(self._line_pen)
+        self._connection_item.setZValue(-1)  # ノードの背面に配置
+        self._scene.addItem(self._connection_item)
 
-            # パスを描画
-            path_item = QGraphicsPathItem(path)
-            path_pen = QPen(self._line_color, 2)
-            path_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            path_item.setPen(path_pen)
-            path_item.setZValue(-1)  # ノードの背面に配置
-            self._scene.addItem(path_item)
+    def _create_line_pen(self, color: QColor) -> QPen:
+        """
+        接続線のペンを作成する
+
+        Args:
+            color: 線の色
+
+        Returns:
+            線幅2・丸い線端のペン
+        """
+        pen = QPen(color, 2)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        return pen
+
+    def _visible_scene_rect(self) -> QRectF:
+        """
+        接続線を描画する範囲（シーン座標）を取得する
+
+        Returns:
+            ビューポートの表示範囲を上下左右に半画面ずつ広げた矩形
+        """
+        view_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        # スクロール直後に線が途切れて見えないよう、表示範囲の周囲にも余白を持たせる
+        margin_x = view_rect.width() / 2
+        margin_y = view_rect.height() / 2
+        return view_rect.adjusted(-margin_x, -margin_y, margin_x, margin_y)
+
+    def _schedule_connection_update(self) -> None:
+        """表示範囲の変更に合わせて接続線を作り直す（連続した変更は1回にまとめる）"""
+        if not self._connection_update_timer.isActive():
+            self._connection_update_timer.start()
+
+    def resizeEvent(self, event) -> None:
+        """
+        リサイズイベントを処理
+
+        Args:
+            event: リサイズイベント
+        """
+        super().resizeEvent(event)
+        self._schedule_connection_update()
 
     def _on_node_dropped(self, dropped_node: Node, target_node: Node) -> None:
         """
@@ -561,7 +867,8 @@ class MindMapView(QGraphicsView):
             dropped_node.parent.remove_child(dropped_node)
         target_node.add_child(dropped_node)
 
-        # ビューを再描画
+        # ビューを再描画（ドラッグで動いたアイテムを戻すため、署名が同じでも作り直す）
+        self._last_tree_sig = None
         self.display_tree(self._root_node)
 
         # 変更をシグナルで通知（シグナルハンドラ内で中心表示を行う）
@@ -613,23 +920,16 @@ class MindMapView(QGraphicsView):
             if delta_y == 0:
                 return
 
-            # ズーム倍率を計算（トラックパッドのスムーズなピンチに対応）
-            # delta_yの値を小さくしてスムーズにズーム
-            zoom_factor = 1.0 + (delta_y / 1200.0)
-
-            # 新しいズームレベルを計算
-            new_zoom = self._zoom_level * zoom_factor
+            # 向きが変わったか間が空いた場合は別の操作とみなし、前の操作から持ち越した回転量を捨てる
+            if (self._pending_wheel_delta * delta_y < 0 or
+                    not self._wheel_clock.isValid() or self._wheel_clock.elapsed() > _WHEEL_GESTURE_GAP_MS):
+                self._pending_wheel_delta = 0
+            self._wheel_clock.restart()
 
-            # ズームレベルの範囲制限
-            if new_zoom < self._zoom_min or new_zoom > self._zoom_max:
-                return
-
-            # ズームレベルを更新
-            self._zoom_level = new_zoom
-
-            # マウスカーソル位置を中心に拡大縮小
-            self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
-            self.scale(zoom_factor, zoom_factor)
+            # 回転量を溜めておき、次のフレームでまとめてズームする
+            self._pending_wheel_delta += delta_y
+            if not self._zoom_timer.isActive():
+                self._zoom_timer.start()
 
             event.accept()
         else:
@@ -649,6 +949,43 @@ class MindMapView(QGraphicsView):
 
             event.accept()
 
+    def _apply_wheel_zoom(self) -> None:
+        """溜まったホイールの回転量をまとめてズームに反映する"""
+        delta_y = self._pending_wheel_delta
+        self._pending_wheel_delta = 0
+        if delta_y == 0:
+            return
+
+        # 新しいズームレベルを段階の数で求める（1ノッチ=120で1段階、トラックパッドの小さな回転量にも対応）
+        current_steps = math.log(self._zoom_level, _ZOOM_STEP)
+        target_steps = current_steps + delta_y / 120.0
+
+        # 回転の向きに段階（_ZOOM_STEPの累乗）へ丸める（ピンチで段階の間にいても逆向きには動かさない）
+        if delta_y > 0:
+            step = math.floor(target_steps + 1e-9)
+            moved = step > current_steps + 1e-9
+        else:
+            step = math.ceil(target_steps - 1e-9)
+            moved = step < current_steps - 1e-9
+        if not moved:
+            # 段階が変わるほどの回転量でなければ次の回転に持ち越す
+            self._pending_wheel_delta += delta_y
+            return
+
+        # 範囲を超える場合は端で止める
+        new_zoom = min(max(pow(_ZOOM_STEP, step), self._zoom_min), self._zoom_max)
+        if math.isclose(new_zoom, self._zoom_level):
+            return
+
+        zoom_factor = new_zoom / self._zoom_level
+
+        # ズームレベルを更新
+        self._zoom_level = new_zoom
+
+        # マウスカーソル位置を中心に拡大縮小
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.scale(zoom_factor, zoom_factor)
+
     def mousePressEvent(self, event) -> None:
         """
         マウス押下イベントを処理
@@ -664,6 +1001,8 @@ class MindMapView(QGraphicsView):
             self._is_panning = True
             self._pan_start_pos = event.pos()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            # パン中はアンチエイリアスを切って描画を軽くする
+            self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
             event.accept()
         else:
             super().mousePressEvent(event)
@@ -680,13 +1019,15 @@ class MindMapView(QGraphicsView):
             delta = event.pos() - self._pan_start_pos
             self._pan_start_pos = event.pos()
 
-            # 水平・垂直スクロールバーの値を変更
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - delta.x()
-            )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - delta.y()
-            )
+            # 水平・垂直スクロールバーの値を変更（動いていない方向は触らない）
+            if delta.x() != 0:
+                self.horizontalScrollBar().setValue(
+                    self.horizontalScrollBar().value() - delta.x()
+                )
+            if delta.y() != 0:
+                self.verticalScrollBar().setValue(
+                    self.verticalScrollBar().value() - delta.y()
+                )
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -706,11 +1047,29 @@ class MindMapView(QGraphicsView):
                 self._is_panning = False
                 self._pan_start_pos = None
                 self.setCursor(Qt.CursorShape.ArrowCursor)
+                # パンが終わったらアンチエイリアスを戻して描き直す
+                self._restore_antialiasing()
                 event.accept()
                 return
 
         super().mouseReleaseEvent(event)
 
+    def _restore_antialiasing(self) -> None:
+        """
+        パンやピンチの間に切っていたアンチエイリアスを戻して描き直す
+
+        ノードアイテムのキャッシュはレンダーヒントを変えても作り直されないため、
+        アンチエイリアスなしで描かれたキャッシュが残らないよう、アイテムごとに無効化する
+        """
+        if self.renderHints() & QPainter.RenderHint.Antialiasing:
+            return
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        for node_item in self._node_items.values():
+            node_item.update()
+        for pooled_items in self._item_pool.values():
+            for node_item in pooled_items:
+                node_item.update()
+
     def keyPressEvent(self, event) -> None:
         """
         キー押下イベントを処理
@@ -719,8 +1078,10 @@ class MindMapView(QGraphicsView):
             event: キーイベント
         """
         # テキスト入力可能なキーの場合、エディタに転送
+        # （ASCIIの印字可能な1文字は、isprintableによるUnicodeの判定を経ずに転送する）
         text = event.text()
-        if text and text.isprintable() and not event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+        if (text and not event.modifiers() & Qt.KeyboardModifier.ControlModifier
+                and ((len(text) == 1 and " " <= text <= "~") or text.isprintable())):
             # 入力可能な文字（Ctrl修飾子がない場合）をエディタに転送
             self.forward_text_input.emit(text)
             event.accept()
@@ -768,12 +1129,23 @@ class MindMapView(QGraphicsView):
         Returns:
             イベントが処理された場合True
         """
+        # ピンチ中はアンチエイリアスを切って描画を軽くし、終わったら戻して描き直す
+        pinch_finished = gesture.state() in (Qt.GestureState.GestureFinished, Qt.GestureState.GestureCanceled)
+        if pinch_finished:
+            self._restore_antialiasing()
+        else:
+            self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
         change_flags = gesture.changeFlags()
 
         # スケール変更がある場合
         if change_flags & QPinchGesture.ChangeFlag.ScaleFactorChanged:
-            # 現在のスケールファクターを取得
-            current_scale = gesture.scaleFactor()
+            # 前回適用してからの倍率を累積し、変化が小さいうちは適用しない（終了時は残りを適用する）
+            self._pending_pinch_scale *= gesture.scaleFactor()
+            if not pinch_finished and abs(self._pending_pinch_scale - 1.0) < 0.01:
+                return True
+            current_scale = self._pending_pinch_scale
+            self._pending_pinch_scale = 1.0
 
             # 新しいズームレベルを計算
             new_zoom = self._zoom_level * current_scale
@@ -813,34 +1185,53 @@ class MindMapView(QGraphicsView):
                 int(self.verticalScrollBar().value() + delta.y())
             )
 
+        # ジェスチャーが終わったら、適用しきれなかった倍率は次のピンチに持ち越さない
+        if pinch_finished:
+            self._pending_pinch_scale = 1.0
+
         return True
 
     def set_font_size(self, size: int) -> None:
         """
         フォントサイズを設定する
 
+        サイズ変更はノードの大きさが変わるため、反映には再レイアウト（display_tree）が必要
+
         Args:
             size: フォントサイズ
         """
+        if size == self._font_size:
+            return
         self._font_size = size
 
     def set_font_color(self, color: QColor) -> None:
         """
         フォント色を設定する
 
+        レイアウトは変わらないため、既存のノードアイテムをその場で更新する
+
         Args:
             color: フォント色
         """
         self._font_color = color
+        for node_item in self._node_items.values():
+            node_item.set_font_color(color)
+        self._scene.update()
 
     def set_line_color(self, color: QColor) -> None:
         """
         線の色を設定する
 
+        レイアウトは変わらないため、既存の接続線のペンだけを差し替える
+
         Args:
             color: 線の色
         """
         self._line_color = color
+        self._line_pen = self._create_line_pen(color)
+        if self._connection_item is not None:
+            self._connection_item.setPen(self._line_pen)
+        self._scene.update()
 
     def set_layout_direction(self, direction: int) -> None:
         """
@@ -851,6 +1242,36 @@ class MindMapView(QGraphicsView):
         """
         self._layout_direction = direction
 
+    def set_use_opengl(self, enabled: bool) -> bool:
+        """
+        OpenGLで描画するかを設定する
+
+        OpenGLのビューポートでは部分的な再描画の利点がないため、再描画は毎回ビューポート全体で行う。
+        QtOpenGLWidgetsが使えない環境では切り替えない
+
+        Args:
+            enabled: TrueならOpenGL、Falseなら通常（ラスター）のビューポートで描画する
+
+        Returns:
+            設定どおりに切り替えられた場合True
+        """
+        if enabled == self._use_opengl:
+            return True
+
+        if enabled:
+            try:
+                from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+            except ImportError:
+                return False
+            self.setViewport(QOpenGLWidget())
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            self.setViewport(QWidget())
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+
+        self._use_opengl = enabled
+        return True
+
     def center_on_node(self, node: Node) -> None:
         """
         指定されたノードを中心に表示し、フォーカス状態にする
@@ -859,7 +1280,7 @@ class MindMapView(QGraphicsView):
             node: 中心に表示するノード
         """
         # ノードに対応するNodeItemを検索
-        node_item = self._node_items.get(node.id)
+        node_item = self._node_items.get(id(node))
         if node_item is None:
             return
 
@@ -915,6 +1336,9 @@ class MindMapView(QGraphicsView):
         """
         マインドマップをPNG形式でエクスポートする
 
+        大きなマップは帯状に分割してレンダリングし、逐次PNGに書き出すことで
+        メモリ使用量を出力サイズに依存しない範囲に抑える
+
         Args:
             file_path: 保存先ファイルパス
 
@@ -929,26 +1353,109 @@ class MindMapView(QGraphicsView):
             margin = 50
             scene_rect.adjust(-margin, -margin, margin, margin)
 
-            # QImageを作成（白背景）
-            image = QImage(
-                int(scene_rect.width()),
-                int(scene_rect.height()),
-                QImage.Format.Format_ARGB32
-            )
-            image.fill(Qt.GlobalColor.white)
+            width = int(scene_rect.width())
+            height = int(scene_rect.height())
+
+            # 表示範囲外の接続線も含めて書き出す
+            self._update_connection_items(cull=False)
+            try:
+                # 大きすぎる画像は帯状に分割して書き出す
+                if width * height > _EXPORT_MAX_IMAGE_PIXELS:
+                    with open(file_path, "wb") as f:
+                        self._write_png_in_bands(f, scene_rect, width, height)
+                    return True
+
+                # QImageを作成（白背景で塗りつぶすためアルファチャンネルは不要）
+                image = QImage(width, height, QImage.Format.Format_RGB32)
+                image.fill(Qt.GlobalColor.white)
+
+                # QPainterでシーンをレンダリング
+                painter = QPainter(image)
+                self._set_export_render_hints(painter)
+
+                # シーンを描画
+                self._scene.render(painter, QRectF(), scene_rect)
+                painter.end()
+
+                # PNG形式で保存
+                return image.save(file_path, "PNG")
+            finally:
+                self._update_connection_items()
+        except Exception as e:
+            print(f"PNG エクスポートエラー: {e}")
+            return False
 
-            # QPainterでシーンをレンダリング
-            painter = QPainter(image)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    def _set_export_render_hints(self, painter: QPainter) -> None:
+        """
+        エクスポート用のレンダリングヒントを設定する
 
-            # シーンを描画
-            self._scene.render(painter, QRectF(), scene_rect)
+        Args:
+            painter: 描画に使うQPainter
+        """
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+    def _write_png_in_bands(self, f: BinaryIO, scene_rect: QRectF, width: int, height: int) -> None:
+        """
+        シーンを帯状にレンダリングしながらPNGを逐次書き出す
+
+        一度に保持する画像は幅 x _EXPORT_BAND_HEIGHT の1帯分のみ
+
+        Args:
+            f: 書き込み先（バイナリモード）
+            scene_rect: レンダリングするシーン範囲
+            width: 出力画像の幅
+            height: 出力画像の高さ
+        """
+        def write_chunk(tag: bytes, data: bytes) -> None:
+            f.write(struct.pack(">I", len(data)))
+            f.write(tag)
+            f.write(data)
+            f.write(struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+        # シグネチャとヘッダ（8bit RGB、インターレースなし）
+        f.write(b"\x89PNG\r\n\x1a\n")
+        write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+        compressor = zlib.compressobj()
+        row_bytes = width * 3
+        # 一括レンダリング時と同じ拡大率（シーン座標/ピクセル）で帯を切り出す
+        scale_y = scene_rect.height() / height
+
+        for band_top in range(0, height, _EXPORT_BAND_HEIGHT):
+            band_height = min(_EXPORT_BAND_HEIGHT, height - band_top)
+
+            # 1帯分だけレンダリング
+            band = QImage(width, band_height, QImage.Format.Format_RGB32)
+            band.fill(Qt.GlobalColor.white)
+            painter = QPainter(band)
+            self._set_export_render_hints(painter)
+            source = QRectF(
+                scene_rect.x(),
+                scene_rect.y() + band_top * scale_y,
+                scene_rect.width(),
+                band_height * scale_y
+            )
+            self._scene.render(painter, QRectF(0, 0, width, band_height), source)
             painter.end()
 
-            # PNG形式で保存
-            return image.save(file_path, "PNG")
-        except Exception as e:
-            print(f"PNG エクスポートエラー: {e}")
-            return False
+            # RGB888に変換して各行の先頭にフィルタ種別（0=None）を付けて圧縮
+            rgb = band.convertToFormat(QImage.Format.Format_RGB888)
+            bytes_per_line = rgb.bytesPerLine()
+            bits = rgb.constBits()
+            bits.setsize(rgb.sizeInBytes())
+            data = bits.asstring()
+
+            rows = bytearray()
+            for y in range(band_height):
+                offset = y * bytes_per_line
+                rows += b"\x00"
+                rows += data[offset:offset + row_bytes]
+
+            compressed = compressor.compress(bytes(rows))
+            if compressed:
+                write_chunk(b"IDAT", compressed)
+
+        write_chunk(b"IDAT", compressor.flush())
+        write_chunk(b"IEND", b"")
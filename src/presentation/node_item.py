@@ -3,11 +3,151 @@
 
 マインドマップのノードを表現するQGraphicsItemで、ドラッグ&ドロップ機能を持つ
 """
-from PyQt6.QtWidgets import QGraphicsObject, QGraphicsTextItem, QGraphicsLineItem
-from PyQt6.QtCore import Qt, QRectF, pyqtSignal
-from PyQt6.QtGui import QPen, QColor, QFont, QPainter
-from typing import Optional
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsObject, QGraphicsPixmapItem, QGraphicsScene
+from PyQt6.QtCore import Qt, QRectF, QLineF, QPointF, QTimer, pyqtSignal
+from PyQt6.QtGui import QPen, QBrush, QColor, QFont, QPainter, QPixmap, QStaticText, QTextDocument, QTransform
+from PyQt6 import sip
+from typing import Optional, Tuple
+from functools import lru_cache
+import weakref
 from src.domain.node import Node
+from src.presentation.spatial import NodeQuadTree
+
+
+# 描画に使う色・ペン・ブラシ（全アイテムで共有し、描画のたびに作らない）
+_DEFAULT_FONT_COLOR = QColor(0, 0, 0)
+_FOCUS_PEN = QPen(QColor(255, 100, 100, 180), 2)  # 薄い赤枠
+_FOCUS_BRUSH = QBrush(QColor(220, 220, 220, 120))  # 薄いグレー
+_DRAG_PEN = QPen(QColor(255, 165, 0), 2)  # 半透明オレンジ
+_DRAG_BRUSH = QBrush(QColor(255, 200, 100, 50))
+_SELECTED_PEN = QPen(QColor(50, 150, 250), 3)  # 青い枠線
+_SELECTED_BRUSH = QBrush(QColor(180, 220, 255, 80))  # 薄い背景
+_HIGHLIGHT_COLOR = QColor(255, 100, 0)  # オレンジ色
+_HIGHLIGHT_PEN = QPen(_HIGHLIGHT_COLOR, 3)  # 太く
+
+# 重なり順（ノードは接続線(-1)より手前、ゴーストは最前面）
+_NODE_Z_VALUE = 0.0
+_GHOST_Z_VALUE = 1000.0
+
+
+@lru_cache(maxsize=64)
+def _underline_pen_for(rgba: int) -> QPen:
+    """
+    下線のペンを取得する（色ごとに1つだけ作成して共有する）
+
+    Args:
+        rgba: 下線の色
+
+    Returns:
+        太さ2のペン
+    """
+    return QPen(QColor.fromRgba(rgba), 2)
+
+
+@lru_cache(maxsize=None)
+def _node_font(font_size: int) -> QFont:
+    """
+    ノードのテキスト用フォントを取得する（サイズごとに1つだけ作成して共有する）
+
+    Args:
+        font_size: フォントサイズ
+
+    Returns:
+        フォント
+    """
+    return QFont("Arial", font_size, QFont.Weight.Normal)
+
+
+# テキストの余白（QGraphicsTextItemと同じ見た目・大きさにするため、QTextDocumentの既定値に合わせる）
+_TEXT_MARGIN = 4
+
+
+@lru_cache(maxsize=4096)
+def _node_label(text: str, font_size: int) -> Tuple[QStaticText, QRectF]:
+    """
+    ノードのテキストのレイアウトを取得する（同じテキスト・サイズのノードで共有する）
+
+    Args:
+        text: テキスト
+        font_size: フォントサイズ
+
+    Returns:
+        (レイアウト済みのテキスト, 余白を含むテキストの矩形)
+    """
+    font = _node_font(font_size)
+
+    label = QStaticText(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.prepare(QTransform(), font)
+
+    # 大きさはQTextDocumentで測り、QGraphicsTextItemのboundingRectと一致させる
+    document = QTextDocument()
+    document.setDocumentMargin(_TEXT_MARGIN)
+    document.setDefaultFont(font)
+    document.setPlainText(text)
+    return label, QRectF(QPointF(0, 0), document.size())
+
+
+@lru_cache(maxsize=64)
+def _ghost_pixmap(text: str, font_size: int, rgba: int) -> QPixmap:
+    """
+    ドラッグ中のゴースト（半透明のテキストと下線）の画像を取得する
+
+    同じテキスト・サイズ・色なら、ドラッグのたびに描き直さず再利用する
+
+    Args:
+        text: テキスト
+        font_size: フォントサイズ
+        rgba: 色（半透明のアルファ値を含む）
+
+    Returns:
+        テキストと下線を描画した画像
+    """
+    label, text_rect = _node_label(text, font_size)
+    color = QColor.fromRgba(rgba)
+
+    # 下線（太さ2）はテキストの2px下に引くので、その分だけ高さを足す
+    underline_y = text_rect.height() + 2
+    pixmap = QPixmap(int(text_rect.width() + 0.5), int(underline_y + 1.5))
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setPen(color)
+    painter.setFont(_node_font(font_size))
+    painter.drawStaticText(QPointF(_TEXT_MARGIN, _TEXT_MARGIN), label)
+    painter.setPen(QPen(color, 2))
+    painter.drawLine(QLineF(0, underline_y, text_rect.width(), underline_y))
+    painter.end()
+    return pixmap
+
+
+# シーンごとに1つだけ作り、ドラッグのたびに表示・非表示を切り替えて使い回すゴースト
+_scene_ghosts: 'weakref.WeakKeyDictionary[QGraphicsScene, QGraphicsPixmapItem]' = weakref.WeakKeyDictionary()
+
+
+def _scene_ghost(scene: QGraphicsScene) -> QGraphicsPixmapItem:
+    """
+    シーンで共有するゴーストアイテムを取得する（初めて使うときに作成してシーンに追加する）
+
+    Args:
+        scene: ドラッグ中のノードがあるシーン
+
+    Returns:
+        非表示のゴーストアイテム
+    """
+    ghost = _scene_ghosts.get(scene)
+    # scene.clear()でアイテムごと削除されていれば作り直す
+    if ghost is None or sip.isdeleted(ghost):
+        ghost = QGraphicsPixmapItem()
+        # ズーム時に文字が粗くならないように補間する
+        ghost.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        ghost.setZValue(_GHOST_Z_VALUE)  # 最前面に表示
+        ghost.setVisible(False)
+        scene.addItem(ghost)
+        _scene_ghosts[scene] = ghost
+    return ghost
 
 
 class NodeItem(QGraphicsObject):
@@ -30,20 +170,84 @@ class NodeItem(QGraphicsObject):
             parent: 親アイテム
         """
         super().__init__(parent)
+        self._hover_target: Optional['NodeItem'] = None
+        # ドロップ先の検索に使う空間インデックス（ビューが配置のたびに作り直すため、弱参照で持つ）
+        self._spatial_index: Optional[weakref.ref] = None
+        self._hover_results: list = []  # 検索結果を受け取るリスト（マウス移動のたびに作らず再利用する）
+        # ドロップ先の検索はマウス移動ごとではなく1フレーム（16ms）ごとにまとめて行う（初めてのドラッグで作成）
+        self._hover_timer: Optional[QTimer] = None
+        self._ghost: Optional[QGraphicsPixmapItem] = None
+
+        # テキストと下線（子アイテムにせず、paintで自分で描く）
+        # テキストのレイアウトは同じテキスト・サイズのノードで共有する
+        self._label: Optional[QStaticText] = None
+        self._font: Optional[QFont] = None
+        self._text_color = QColor()
+        self._underline_line = QLineF()
+        self._underline_pen = QPen()
+        # 設定済みの（テキスト, フォントサイズ）。同じなら矩形を計算し直さない
+        self._text_key: Optional[tuple] = None
+
+        self._bind(node, depth, font_size, font_color)
+
+        # ドラッグ可能に設定
+        self.setFlag(QGraphicsObject.GraphicsItemFlag.ItemIsMovable, True)  # ドラッグで移動可能に
+        self.setFlag(QGraphicsObject.GraphicsItemFlag.ItemIsSelectable, True)
+        self.setFlag(QGraphicsObject.GraphicsItemFlag.ItemSendsGeometryChanges, True)  # 位置変更を検出
+        self.setAcceptHoverEvents(True)
+        self.setZValue(_NODE_Z_VALUE)
+
+        # 選択枠と下線の描画結果をキャッシュする（状態が変わるときはupdateで描き直す）
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def reset(self, node: Node, depth: int, font_size: int = 14, font_color: QColor = None) -> None:
+        """
+        別のノードを割り当て直す（アイテムを再利用する場合に使う）
+
+        Args:
+            node: ドメインモデルのNode
+            depth: 階層の深さ
+            font_size: フォントサイズ
+            font_color: フォント色
+        """
+        # 前のノードの操作状態を破棄
+        self._remove_ghost()
+        if self._hover_timer is not None:
+            self._hover_timer.stop()
+        if self._hover_target is not None:
+            self._hover_target.set_highlight(False)
+            self._hover_target = None
+        self.setOpacity(1.0)
+
+        # テキストが変わると境界矩形も変わる
+        self.prepareGeometryChange()
+        self._bind(node, depth, font_size, font_color)
+        # 選択状態や下線の色が変わるため、キャッシュした描画結果を破棄する
+        self.update()
+
+    def _bind(self, node: Node, depth: int, font_size: int, font_color: Optional[QColor]) -> None:
+        """
+        ノードの内容を状態とテキスト・下線アイテムに反映する
+
+        Args:
+            node: ドメインモデルのNode
+            depth: 階層の深さ
+            font_size: フォントサイズ
+            font_color: フォント色
+        """
         self._node = node
         self._depth = depth
         self._is_dragging = False
         self._drag_start_pos = None
         self._drag_start_item_pos = None  # ドラッグ開始時のアイテムの位置
-        self._hover_target: Optional['NodeItem'] = None
-        self._ghost_text: Optional[QGraphicsTextItem] = None
-        self._ghost_underline: Optional[QGraphicsLineItem] = None
+        self._pending_hover_pos = None  # まだドロップ先を検索していないマウス位置
         self._is_selected = False  # 選択状態
         self._is_focused = False  # フォーカス状態（カーソル位置に対応）
+        self._is_highlighted = False  # ドロップ先としてのハイライト状態
 
         # フォント設定（Nodeに設定があればそれを使用、なければデフォルト）
         self._default_font_size = font_size
-        self._default_font_color = font_color if font_color is not None else QColor(0, 0, 0)
+        self._default_font_color = font_color if font_color is not None else _DEFAULT_FONT_COLOR
 
         # ノード個別の設定があれば優先
         if node.font_size is not None:
@@ -56,27 +260,26 @@ class NodeItem(QGraphicsObject):
         else:
             self._font_color = self._default_font_color
 
-        # テキストアイテムを作成
-        self._text_item = QGraphicsTextItem(node.text, self)
-        text_font = QFont("Arial", self._font_size, QFont.Weight.Normal)
-        self._text_item.setFont(text_font)
-        self._text_item.setDefaultTextColor(self._font_color)
-        # boundingRectが(-15, -15)から始まるので、テキストを(15, 15)にオフセット
-        self._text_item.setPos(15, 15)
-
-        # 下線アイテムを作成
-        text_rect = self._text_item.boundingRect()
-        underline_y = text_rect.height() + 2 + 15  # テキストのオフセット分を追加
-        self._underline = QGraphicsLineItem(15, underline_y,
-                                           text_rect.width() + 15, underline_y, self)
-        underline_pen = QPen(self._font_color, 2)
-        self._underline.setPen(underline_pen)
+        # テキストを設定（同じノードを再表示する場合など、内容が変わらなければレイアウトし直さない）
+        text_key = (node.text, self._font_size)
+        if text_key != self._text_key:
+            self._text_key = text_key
+            self._label, text_rect = _node_label(node.text, self._font_size)
+            self._font = _node_font(self._font_size)
 
-        # ドラッグ可能に設定
-        self.setFlag(QGraphicsObject.GraphicsItemFlag.ItemIsMovable, True)  # ドラッグで移動可能に
-        self.setFlag(QGraphicsObject.GraphicsItemFlag.ItemIsSelectable, True)
-        self.setFlag(QGraphicsObject.GraphicsItemFlag.ItemSendsGeometryChanges, True)  # 位置変更を検出
-        self.setAcceptHoverEvents(True)
+            # 下線を設定
+            underline_y = text_rect.height() + 2 + 15  # テキストのオフセット分を追加
+            self._underline_line = QLineF(15, underline_y, text_rect.width() + 15, underline_y)
+            # テキストと下線を囲む矩形（色だけが変わるときは、この範囲だけ描き直す）
+            # ハイライト時の太い下線とアンチエイリアスの分だけ広げる
+            self._label_rect = QRectF(15, 15, text_rect.width(), underline_y - 15).adjusted(-3, -3, 3, 3)
+
+            # 境界矩形と選択枠の矩形もテキストが変わったときだけ計算し直す
+            self._bounding_rect = self._calculate_bounding_rect(text_rect)
+            self._content_rect = self._calculate_content_rect(text_rect)
+        self._text_color = self._font_color
+
+        self._underline_pen = _underline_pen_for(self._font_color.rgba())
 
     @property
     def node(self) -> Node:
@@ -88,22 +291,30 @@ class NodeItem(QGraphicsObject):
         """階層の深さを取得"""
         return self._depth
 
-    def boundingRect(self) -> QRectF:
-        """アイテムの境界矩形を返す"""
-        text_rect = self._text_item.boundingRect()
+    def _calculate_bounding_rect(self, text_rect: QRectF) -> QRectF:
+        """
+        テキストの矩形からアイテムの境界矩形を計算する
+
+        Args:
+            text_rect: テキストアイテムの境界矩形
+
+        Returns:
+            アイテムの境界矩形
+        """
         # 選択枠とドラッグ&ドロップ用の余白を含める
         # 上下左右に15pxの余白を追加して、ドロップ先として認識される範囲を広げる
         return QRectF(-15, -15, text_rect.width() + 30, text_rect.height() + 34)
 
-    def paint(self, painter: QPainter, option, widget=None) -> None:
+    def _calculate_content_rect(self, text_rect: QRectF) -> QRectF:
         """
-        カスタム描画（必要に応じて）
+        テキストの矩形から選択枠などを描く矩形を計算する
+
+        Args:
+            text_rect: テキストアイテムの境界矩形
 
-        Note: 子アイテム（text_item, underline）が自動的に描画されるため、
-        ここでは選択状態やドラッグ中の視覚効果のみ描画
+        Returns:
+            テキストと下線を囲む矩形
         """
-        # テキストを囲む矩形を計算（テキストと下線を含む）
-        text_rect = self._text_item.boundingRect()
         # テキストは(15, 15)の位置にあり、下線は text_rect.height() + 2 + 15 の位置にある
         # 適度なパディングを持たせてテキストを中心に配置
         padding = 8
@@ -112,25 +323,47 @@ class NodeItem(QGraphicsObject):
         content_width = text_rect.width() + padding * 2
         # 下線の位置を考慮した高さ（テキストの高さ + 下線までの余白 + パディング）
         content_height = text_rect.height() + 4 + padding * 2
-        content_rect = QRectF(content_x, content_y, content_width, content_height)
+        return QRectF(content_x, content_y, content_width, content_height)
+
+    def boundingRect(self) -> QRectF:
+        """アイテムの境界矩形を返す（テキストが変わったときに計算した値）"""
+        return self._bounding_rect
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        """
+        カスタム描画（必要に応じて）
+
+        Note: 選択状態やドラッグ中の視覚効果の上に、下線とテキストを描画
+        """
+        # テキストを囲む矩形（テキストと下線を含む）
+        content_rect = self._content_rect
 
         # フォーカス状態の背景（一番下に描画）
         if self._is_focused:
-            painter.setPen(QPen(QColor(255, 100, 100, 180), 2))  # 薄い赤枠
-            painter.setBrush(QColor(220, 220, 220, 120))  # 薄いグレー
+            painter.setPen(_FOCUS_PEN)  # 薄い赤枠
+            painter.setBrush(_FOCUS_BRUSH)  # 薄いグレー
             painter.drawRoundedRect(content_rect, 5, 5)
 
         if self._is_dragging:
             # ドラッグ中は半透明オレンジ
-            painter.setPen(QPen(QColor(255, 165, 0), 2))
-            painter.setBrush(QColor(255, 200, 100, 50))
+            painter.setPen(_DRAG_PEN)
+            painter.setBrush(_DRAG_BRUSH)
             painter.drawRoundedRect(content_rect, 5, 5)
         elif self._is_selected:
             # 選択中は青い枠線と薄い背景
-            painter.setPen(QPen(QColor(50, 150, 250), 3))
-            painter.setBrush(QColor(180, 220, 255, 80))
+            painter.setPen(_SELECTED_PEN)
+            painter.setBrush(_SELECTED_BRUSH)
             painter.drawRoundedRect(content_rect, 5, 5)
 
+        # 下線（選択枠などの上に描画）
+        painter.setPen(self._underline_pen)
+        painter.drawLine(self._underline_line)
+
+        # テキスト（boundingRectが(-15, -15)から始まるので、テキストは(15, 15)に余白を足した位置）
+        painter.setPen(self._text_color)
+        painter.setFont(self._font)
+        painter.drawStaticText(QPointF(15 + _TEXT_MARGIN, 15 + _TEXT_MARGIN), self._label)
+
     def mousePressEvent(self, event) -> None:
         """マウス押下イベント"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -152,7 +385,15 @@ class NodeItem(QGraphicsObject):
             self._update_ghost(event.scenePos())
 
             # ドロップ先候補を検出（ノードは動かさない）
-            self._update_hover_target(event.scenePos())
+            # 位置を溜めておき、次のフレームでまとめて検索する
+            self._pending_hover_pos = event.scenePos()
+            if self._hover_timer is None:
+                self._hover_timer = QTimer(self)
+                self._hover_timer.setSingleShot(True)
+                self._hover_timer.setInterval(16)
+                self._hover_timer.timeout.connect(self._apply_pending_hover)
+            if not self._hover_timer.isActive():
+                self._hover_timer.start()
             # ドラッグ中はノード本体を動かさない（接続線の残像を防ぐため）
             return
         super().mouseMoveEvent(event)
@@ -161,6 +402,11 @@ class NodeItem(QGraphicsObject):
         """マウスリリースイベント"""
         # ドラッグ中であれば、どのボタンでも終了処理を行う
         if self._is_dragging:
+            # まだ検索していない移動があれば、ドロップ先を確定させる前に反映する
+            if self._hover_timer is not None and self._hover_timer.isActive():
+                self._hover_timer.stop()
+                self._apply_pending_hover()
+
             self._is_dragging = False
             self.setOpacity(1.0)  # 不透明に戻す
 
@@ -202,6 +448,14 @@ class NodeItem(QGraphicsObject):
             self.update()
         super().mouseReleaseEvent(event)
 
+    def _apply_pending_hover(self) -> None:
+        """溜めておいたマウス位置でドロップ先候補を更新する"""
+        scene_pos = self._pending_hover_pos
+        self._pending_hover_pos = None
+        if scene_pos is None or not self._is_dragging or self.scene() is None:
+            return
+        self._update_hover_target(scene_pos)
+
     def _update_hover_target(self, scene_pos) -> None:
         """
         ドロップ先候補を更新
@@ -209,20 +463,36 @@ class NodeItem(QGraphicsObject):
         Args:
             scene_pos: 現在のマウス位置（シーン座標）
         """
-        # 前のハイライトをクリア
+        # まだ同じドロップ先の上にいる場合は、検索し直さない（ノード同士は重ならない）
         if self._hover_target is not None:
+            if self._hover_target.sceneBoundingRect().contains(scene_pos):
+                return
+
+            # 前のハイライトをクリア
             self._hover_target.set_highlight(False)
             self._hover_target = None
 
-        # 現在位置の下にあるアイテムを検索
-        items = self.scene().items(scene_pos)
-        for item in items:
-            if isinstance(item, NodeItem) and item != self:
+        # 現在位置を含むノードを空間インデックスから検索（シーン全体の走査を避ける）
+        index = self._spatial_index() if self._spatial_index is not None else None
+        if index is None:
+            return
+        for item in index.query(scene_pos, self._hover_results):
+            if item is not self:
                 # 自分自身の子孫ノードには付け替えできない
                 if not self._is_descendant(item.node):
                     self._hover_target = item
                     item.set_highlight(True)
                     break
+        self._hover_results.clear()
+
+    def set_spatial_index(self, index: NodeQuadTree) -> None:
+        """
+        ドロップ先の検索に使う空間インデックスを設定する
+
+        Args:
+            index: 配置済みのノードアイテムを登録した空間インデックス
+        """
+        self._spatial_index = weakref.ref(index)
 
     def _is_descendant(self, node: Node) -> bool:
         """
@@ -234,15 +504,14 @@ class NodeItem(QGraphicsObject):
         Returns:
             子孫ノードの場合True
         """
-        def check_recursive(current: Node) -> bool:
-            if current == node:
+        # 判定するノードから親をたどり、自分に行き着けば子孫（自分自身も含む）
+        # サブツリー全体をたどる代わりに、深さ分だけの比較で済む
+        current = node
+        while current is not None:
+            if current is self._node:
                 return True
-            for child in current.children:
-                if check_recursive(child):
-                    return True
-            return False
-
-        return check_recursive(self._node)
+            current = current.parent
+        return False
 
     def set_highlight(self, highlight: bool) -> None:
         """
@@ -251,14 +520,41 @@ class NodeItem(QGraphicsObject):
         Args:
             highlight: True=ハイライト、False=通常
         """
+        # 状態が変わらなければ描き直さない（キャッシュした描画結果を捨てずに済む）
+        if highlight == self._is_highlighted:
+            return
+        self._is_highlighted = highlight
+
         if highlight:
-            self._text_item.setDefaultTextColor(QColor(255, 100, 0))  # オレンジ色
-            self._underline.setPen(QPen(QColor(255, 100, 0), 3))  # 太く
+            self._text_color = _HIGHLIGHT_COLOR  # オレンジ色
+            self._underline_pen = _HIGHLIGHT_PEN  # 太く
         else:
             # フォント色を元に戻す
-            self._text_item.setDefaultTextColor(self._font_color)
-            self._underline.setPen(QPen(self._font_color, 2))
-        self.update()
+            self._text_color = self._font_color
+            self._underline_pen = _underline_pen_for(self._font_color.rgba())
+        # 選択枠などは変わらないので、テキストと下線の範囲だけ描き直す
+        self.update(self._label_rect)
+
+    def set_font_color(self, color: QColor) -> None:
+        """
+        デフォルトのフォント色を変更する
+
+        ノード個別の色が設定されている場合はそちらを優先し、表示は変えない
+
+        Args:
+            color: フォント色
+        """
+        self._default_font_color = color
+        if self._node.font_color is not None:
+            return
+
+        self._font_color = color
+        # ハイライト中はハイライト解除時に新しい色が反映される
+        if self._is_highlighted:
+            return
+        self._text_color = color
+        self._underline_pen = _underline_pen_for(color.rgba())
+        self.update(self._label_rect)
 
     def set_selected(self, selected: bool) -> None:
         """
@@ -267,6 +563,8 @@ class NodeItem(QGraphicsObject):
         Args:
             selected: True=選択、False=非選択
         """
+        if selected == self._is_selected:
+            return
         self._is_selected = selected
         self.update()
 
@@ -286,6 +584,9 @@ class NodeItem(QGraphicsObject):
         Args:
             focused: True=フォーカス、False=非フォーカス
         """
+        # カーソル移動のたびに同じノードへフォーカスし直しても、描き直さない
+        if focused == self._is_focused:
+            return
         self._is_focused = focused
         self.update()
 
@@ -293,30 +594,19 @@ class NodeItem(QGraphicsObject):
         """
         ゴーストアイテム（カーソルに追従する半透明テキスト）を作成
 
+        テキストと下線は1枚の画像にまとめ、ドラッグ中は位置を動かすだけにする
+        アイテムはシーンで共有し、作成・削除せずに画像を差し替えて表示する
+
         Args:
             scene_pos: 初期位置（シーン座標）
         """
-        # ゴーストテキストアイテムを作成
-        self._ghost_text = QGraphicsTextItem(self._node.text)
-        text_font = QFont("Arial", self._font_size, QFont.Weight.Normal)
-        self._ghost_text.setFont(text_font)
         ghost_color = QColor(self._font_color)
         ghost_color.setAlpha(150)  # 半透明
-        self._ghost_text.setDefaultTextColor(ghost_color)
-        self._ghost_text.setZValue(1000)  # 最前面に表示
-
-        # ゴースト下線アイテムを作成
-        text_rect = self._ghost_text.boundingRect()
-        underline_y = text_rect.height() + 2
-        self._ghost_underline = QGraphicsLineItem(0, underline_y,
-                                                  text_rect.width(), underline_y)
-        ghost_pen = QPen(ghost_color, 2)
-        self._ghost_underline.setPen(ghost_pen)
-        self._ghost_underline.setZValue(1000)
-
-        # シーンに追加
-        self.scene().addItem(self._ghost_text)
-        self.scene().addItem(self._ghost_underline)
+        pixmap = _ghost_pixmap(self._node.text, self._font_size, ghost_color.rgba())
+
+        self._ghost = _scene_ghost(self.scene())
+        self._ghost.setPixmap(pixmap)
+        self._ghost.setVisible(True)
 
         # 初期位置を設定
         self._update_ghost(scene_pos)
@@ -328,32 +618,15 @@ class NodeItem(QGraphicsObject):
         Args:
             scene_pos: カーソル位置（シーン座標）
         """
-        if self._ghost_text is not None and self._ghost_underline is not None:
-            # テキストの位置を設定（カーソルの少し右下に表示）
-            offset_x = 10
-            offset_y = 10
-            self._ghost_text.setPos(scene_pos.x() + offset_x, scene_pos.y() + offset_y)
-
-            # 下線の位置を設定
-            text_rect = self._ghost_text.boundingRect()
-            underline_y = scene_pos.y() + offset_y + text_rect.height() + 2
-            self._ghost_underline.setLine(
-                scene_pos.x() + offset_x,
-                underline_y,
-                scene_pos.x() + offset_x + text_rect.width(),
-                underline_y
-            )
+        if self._ghost is not None:
+            # カーソルの少し右下に表示
+            self._ghost.setPos(scene_pos.x() + 10, scene_pos.y() + 10)
 
     def _remove_ghost(self) -> None:
-        """ゴーストアイテムを削除"""
-        if self._ghost_text is not None:
-            scene = self.scene()
-            if scene is not None:
-                scene.removeItem(self._ghost_text)
-            self._ghost_text = None
-
-        if self._ghost_underline is not None:
-            scene = self.scene()
-            if scene is not None:
-                scene.removeItem(self._ghost_underline)
-            self._ghost_underline = None
+        """ゴーストアイテムを非表示にする（次のドラッグで再利用する）"""
+        if self._ghost is not None:
+            if not sip.isdeleted(self._ghost):
+                self._ghost.setVisible(False)
+                # 非表示のアイテムもitemsBoundingRectには含まれるため、画像を外して大きさを0にする
+                self._ghost.setPixmap(QPixmap())
+            self._ghost = None
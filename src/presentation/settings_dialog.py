@@ -5,10 +5,11 @@
 """
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QSpinBox, QColorDialog, QGroupBox, QRadioButton, QButtonGroup, QTabWidget
+    QPushButton, QSpinBox, QColorDialog, QGroupBox, QRadioButton, QButtonGroup, QTabWidget, QCheckBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor
+from typing import Optional
 
 
 class SettingsDialog(QDialog):
@@ -34,6 +35,12 @@ class SettingsDialog(QDialog):
         self._font_color = QColor(0, 0, 0)
         self._line_color = QColor(150, 150, 150)
         self._layout_direction = 0  # 0: 右のみ, 1: 左右交互
+        self._pane_orientation = 0  # 0: 左右, 1: 上下
+        self._use_opengl = False
+
+        # レイアウト設定タブの中身は初めて開いたときに作る（それまでは上の設定値を保持する）
+        self._layout_tab: Optional[QGroupBox] = None
+        self._layout_button_group: Optional[QButtonGroup] = None
 
         self._setup_ui()
 
@@ -49,8 +56,10 @@ class SettingsDialog(QDialog):
         tab_widget.addTab(font_tab, "フォント設定")
 
         # === タブ2: レイアウト設定 ===
-        layout_tab = self._create_layout_tab()
-        tab_widget.addTab(layout_tab, "レイアウト設定")
+        # 多くの場合はフォント設定だけを変更するため、中身はタブを開いたときに作る
+        self._layout_tab = QGroupBox()
+        self._layout_tab_index = tab_widget.addTab(self._layout_tab, "レイアウト設定")
+        tab_widget.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(tab_widget)
 
@@ -154,9 +163,19 @@ class SettingsDialog(QDialog):
         font_tab_widget.setLayout(font_tab_layout)
         return font_tab_widget
 
-    def _create_layout_tab(self):
-        """レイアウト設定タブを作成"""
-        layout_tab_widget = QGroupBox()
+    def _on_tab_changed(self, index: int) -> None:
+        """
+        タブが切り替わったときの処理
+
+        Args:
+            index: 表示されたタブの位置
+        """
+        if index == self._layout_tab_index and self._layout_button_group is None:
+            self._create_layout_tab()
+
+    def _create_layout_tab(self) -> None:
+        """レイアウト設定タブの中身を作成し、保持していた設定値を反映する"""
+        layout_tab_widget = self._layout_tab
         layout_tab_layout = QVBoxLayout()
 
         # ペイン配置設定グループ
@@ -201,6 +220,16 @@ class SettingsDialog(QDialog):
         layout_group.setLayout(layout_layout)
         layout_tab_layout.addWidget(layout_group)
 
+        # 描画設定グループ
+        render_group = QGroupBox("描画設定")
+        render_layout = QVBoxLayout()
+
+        self._use_opengl_checkbox = QCheckBox("OpenGLで描画する（表示が乱れる場合はオフにしてください）")
+        render_layout.addWidget(self._use_opengl_checkbox)
+
+        render_group.setLayout(render_layout)
+        layout_tab_layout.addWidget(render_group)
+
         layout_tab_layout.addStretch()
 
         # レイアウト設定タブの適用ボタン
@@ -212,7 +241,11 @@ class SettingsDialog(QDialog):
         layout_tab_layout.addLayout(layout_apply_layout)
 
         layout_tab_widget.setLayout(layout_tab_layout)
-        return layout_tab_widget
+
+        # 保持していた設定値を反映
+        self.set_layout_direction(self._layout_direction)
+        self.set_pane_orientation(self._pane_orientation)
+        self.set_use_opengl(self._use_opengl)
 
     def _apply_font_settings(self) -> None:
         """フォント設定を適用"""
@@ -231,9 +264,7 @@ class SettingsDialog(QDialog):
 
     def _update_color_button(self) -> None:
         """カラーボタンの表示を更新する"""
-        self._color_button.setStyleSheet(
-            f"background-color: {self._font_color.name()};"
-        )
+        self._set_button_color(self._color_button, self._font_color)
 
     def _choose_line_color(self) -> None:
         """線の色選択ダイアログを表示する"""
@@ -244,9 +275,21 @@ class SettingsDialog(QDialog):
 
     def _update_line_color_button(self) -> None:
         """線の色ボタンの表示を更新する"""
-        self._line_color_button.setStyleSheet(
-            f"background-color: {self._line_color.name()};"
-        )
+        self._set_button_color(self._line_color_button, self._line_color)
+
+    def _set_button_color(self, button: QPushButton, color: QColor) -> None:
+        """
+        ボタンの背景色を設定する
+
+        スタイルシートは設定のたびに解析し直されるため、色が変わらなければ設定しない
+
+        Args:
+            button: 色を表示するボタン
+            color: 背景色
+        """
+        style_sheet = f"background-color: {color.name()};"
+        if button.styleSheet() != style_sheet:
+            button.setStyleSheet(style_sheet)
 
     def set_font_size(self, size: int) -> None:
         """
@@ -322,6 +365,8 @@ class SettingsDialog(QDialog):
             direction: 0=右のみ, 1=左右交互, 2=下のみ, 3=上下交互
         """
         self._layout_direction = direction
+        if self._layout_button_group is None:
+            return
         if direction == 0:
             self._layout_right_only.setChecked(True)
         elif direction == 1:
@@ -338,6 +383,8 @@ class SettingsDialog(QDialog):
         Returns:
             0: 右のみ、1: 左右交互、2: 下のみ、3: 上下交互
         """
+        if self._layout_button_group is None:
+            return self._layout_direction
         return self._layout_button_group.checkedId()
 
     def set_pane_orientation(self, orientation: int) -> None:
@@ -347,6 +394,9 @@ class SettingsDialog(QDialog):
         Args:
             orientation: 0=左右、1=上下
         """
+        self._pane_orientation = orientation
+        if self._layout_button_group is None:
+            return
         if orientation == 0:
             self._pane_horizontal.setChecked(True)
         else:
@@ -359,4 +409,29 @@ class SettingsDialog(QDialog):
         Returns:
             0: 左右、1: 上下
         """
+        if self._layout_button_group is None:
+            return self._pane_orientation
         return self._pane_orientation_button_group.checkedId()
+
+    def set_use_opengl(self, enabled: bool) -> None:
+        """
+        OpenGLで描画するかを設定する
+
+        Args:
+            enabled: OpenGLで描画する場合True
+        """
+        self._use_opengl = enabled
+        if self._layout_button_group is None:
+            return
+        self._use_opengl_checkbox.setChecked(enabled)
+
+    def get_use_opengl(self) -> bool:
+        """
+        OpenGLで描画するかを取得する
+
+        Returns:
+            OpenGLで描画する場合True
+        """
+        if self._layout_button_group is None:
+            return self._use_opengl
+        return self._use_opengl_checkbox.isChecked()
@@ -0,0 +1,118 @@
+"""
+空間インデックス
+
+ノードアイテムの矩形を4分木で管理し、座標を含むノードを素早く検索する
+"""
+from PyQt6.QtCore import QRectF, QPointF
+from typing import Optional, List, Tuple
+
+
+# 1つの区画に置く矩形の数の上限（超えたら4つに分割する）
+_MAX_ENTRIES = 10
+# 分割の深さの上限
+_MAX_DEPTH = 8
+
+
+class NodeQuadTree:
+    """ノードアイテムの矩形の4分木"""
+
+    def __init__(self, rect: QRectF, depth: int = 0) -> None:
+        """
+        4分木を初期化する
+
+        Args:
+            rect: 管理する範囲（シーン座標）
+            depth: 分割の深さ（ルートは0）
+        """
+        self._rect = QRectF(rect)
+        self._depth = depth
+        # この区画に置く（矩形, アイテム）。子区画に収まらない矩形もここに残す
+        self._entries: List[Tuple[QRectF, object]] = []
+        self._children: Optional[List['NodeQuadTree']] = None
+
+    def insert(self, rect: QRectF, item: object) -> None:
+        """
+        矩形とアイテムを追加する
+
+        Args:
+            rect: アイテムの矩形（シーン座標）
+            item: 検索で返すアイテム
+        """
+        # 矩形が収まる子区画がある限り下りていく（再帰なし）
+        tree = self
+        while tree._children is not None:
+            child = tree._child_containing(rect)
+            if child is None:
+                break
+            tree = child
+
+        tree._entries.append((rect, item))
+        if tree._children is None and len(tree._entries) > _MAX_ENTRIES and tree._depth < _MAX_DEPTH:
+            tree._split()
+
+    def query(self, point: QPointF, results: Optional[list] = None) -> list:
+        """
+        指定した座標を含む矩形のアイテムを検索する
+
+        Args:
+            point: 座標（シーン座標）
+            results: 結果を書き込むリスト（指定すると中身を入れ替えて再利用する）
+
+        Returns:
+            座標を含む矩形のアイテムのリスト
+        """
+        if results is None:
+            results = []
+        else:
+            results.clear()
+
+        # 座標を含む区画だけをたどる（区画の境界上では隣の区画も調べる）
+        stack = [self]
+        while stack:
+            tree = stack.pop()
+            for rect, item in tree._entries:
+                if rect.contains(point):
+                    results.append(item)
+            if tree._children is not None:
+                for child in tree._children:
+                    if child._rect.contains(point):
+                        stack.append(child)
+        return results
+
+    def _split(self) -> None:
+        """区画を4つに分割し、子区画に収まる矩形を移す"""
+        x = self._rect.x()
+        y = self._rect.y()
+        half_width = self._rect.width() / 2
+        half_height = self._rect.height() / 2
+        depth = self._depth + 1
+        self._children = [
+            NodeQuadTree(QRectF(x, y, half_width, half_height), depth),
+            NodeQuadTree(QRectF(x + half_width, y, half_width, half_height), depth),
+            NodeQuadTree(QRectF(x, y + half_height, half_width, half_height), depth),
+            NodeQuadTree(QRectF(x + half_width, y + half_height, half_width, half_height), depth),
+        ]
+
+        entries = self._entries
+        self._entries = []
+        for rect, item in entries:
+            child = self._child_containing(rect)
+            if child is not None:
+                child._entries.append((rect, item))
+            else:
+                self._entries.append((rect, item))
+
+    def _child_containing(self, rect: QRectF) -> Optional['NodeQuadTree']:
+        """
+        矩形全体が収まる子区画を取得する
+
+        Args:
+            rect: 矩形
+
+        Returns:
+            矩形が収まる子区画（複数の区画にまたがる場合はNone）
+        """
+        for child in self._children:
+            if child._rect.contains(rect):
+                return child
+        return None
@@ -108,6 +108,35 @@ class TestMindMapNodeManagement:
         found = mindmap.find_node_by_id(child1.id)
         assert found == child1
 
+    def test_get_all_nodes_in_depth_first_order(self):
+        """全ノードを深さ優先探索順に返す"""
+        mindmap = MindMap()
+        root = Node(text="ルート")
+        child1 = Node(text="子1")
+        child2 = Node(text="子2")
+        grandchild = Node(text="孫")
+
+        root.add_child(child1)
+        root.add_child(child2)
+        child1.add_child(grandchild)
+        mindmap.set_root(root)
+
+        assert mindmap.get_all_nodes() == [root, child1, grandchild, child2]
+
+    def test_find_node_by_id_in_deep_tree(self):
+        """再帰の上限より深いツリーでもIDでノードを検索できる"""
+        mindmap = MindMap()
+        root = Node(text="ルート")
+        mindmap.set_root(root)
+        node = root
+        for i in range(3000):
+            child = Node(text=f"子{i}")
+            node.add_child(child)
+            node = child
+
+        assert mindmap.find_node_by_id(node.id) == node
+        assert len(mindmap.get_all_nodes()) == 3001
+
     def test_find_node_by_id_not_found(self):
         """存在しないIDで検索するとNoneを返す"""
         mindmap = MindMap()
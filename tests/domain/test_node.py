@@ -4,7 +4,7 @@ Nodeクラスのテスト
 Nodeはマインドマップの各ノード（節点）を表すドメインモデル
 """
 import pytest
-from src.domain.node import Node
+from src.domain.node import Node, _INTERN_TABLE_SIZE, _interned_texts
 
 
 class TestNodeCreation:
@@ -92,6 +92,35 @@ class TestNodeHierarchy:
         assert child not in old_parent.children
         assert child in new_parent.children
 
+    def test_add_child_after_removing_all_children(self):
+        """子ノードを全て削除した後も子ノードを追加できる"""
+        parent = Node(text="親")
+        child1 = Node(text="子1")
+        child2 = Node(text="子2")
+
+        parent.add_child(child1)
+        parent.remove_child(child1)
+        parent.remove_child(child1)  # 子がない状態での削除は何もしない
+        parent.add_child(child2)
+
+        assert parent.children == [child2]
+        assert child1.parent is None
+
+    def test_add_children(self):
+        """複数の子ノードをまとめて追加でき、他の親を持つ子ノードは移動する"""
+        old_parent = Node(text="元の親")
+        parent = Node(text="親")
+        child1 = Node(text="子1")
+        child2 = Node(text="子2")
+        old_parent.add_child(child2)
+
+        parent.add_children([child1, child2])
+
+        assert parent.children == [child1, child2]
+        assert child1.parent == parent
+        assert child2.parent == parent
+        assert old_parent.children == []
+
 
 class TestNodePosition:
     """ノードの位置に関するテスト"""
@@ -123,3 +152,17 @@ class TestNodeText:
         """空のテキストでノードを作成できる"""
         node = Node(text="")
         assert node.text == ""
+
+    def test_same_short_text_is_shared(self):
+        """同じ短いテキストのノードは同じ文字列オブジェクトを共有する"""
+        node1 = Node(text="".join(["TO", "DO"]))
+        node2 = Node(text="ノード")
+        node2.text = "".join(["T", "ODO"])
+        assert node1.text is node2.text
+
+    def test_shared_text_table_is_bounded(self):
+        """共有するテキストの表は上限を超えて大きくならない"""
+        for i in range(_INTERN_TABLE_SIZE + 10):
+            Node(text=f"編集中{i}")
+
+        assert len(_interned_texts) <= _INTERN_TABLE_SIZE
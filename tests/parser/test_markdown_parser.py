@@ -135,6 +135,19 @@ class TestMarkdownParserEdgeCases:
         assert len(root.children) == 1
         assert root.children[0].text == "子"
 
+    def test_parse_skip_invalid_heading_lines(self):
+        """#の後に空白がない行や、#が7個以上の行は見出しとして扱わない"""
+        parser = MarkdownParser()
+        markdown = """# ルート
+##空白なし
+####### 7個
+##\tタブ区切り"""
+        root = parser.parse(markdown)
+
+        assert root.text == "ルート"
+        assert len(root.children) == 1
+        assert root.children[0].text == "タブ区切り"
+
     def test_parse_heading_level_skip(self):
         """見出しレベルが飛んでいても処理できる"""
         parser = MarkdownParser()
@@ -157,6 +170,19 @@ class TestMarkdownParserEdgeCases:
         assert root is not None
         assert root.text == "子から始まる"
 
+    def test_parse_same_text_twice_returns_new_tree(self):
+        """同じテキストを2回パースしても、別々のノードツリーが作られる"""
+        parser = MarkdownParser()
+        markdown = """- ルート
+  - 子"""
+        root1 = parser.parse(markdown)
+        root2 = parser.parse(markdown)
+
+        assert root1 is not root2
+        assert root1.children[0] is not root2.children[0]
+        assert root2.children[0].text == "子"
+        assert parser.get_node_by_line(1) is root2.children[0]
+
 
 class TestMarkdownParserListNotation:
     """リスト表記のパースのテスト"""
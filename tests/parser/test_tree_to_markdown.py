@@ -77,3 +77,33 @@ class TestTreeToMarkdownConverter:
     - Level 2
       - Level 3"""
         assert result == expected
+
+    def test_convert_very_deep_nesting(self, converter):
+        """再帰の上限より深いネスト構造も変換できる"""
+        root = Node(text="Level 0")
+        node = root
+        for i in range(1, 3001):
+            child = Node(text=f"Level {i}")
+            node.add_child(child)
+            node = child
+
+        lines = converter.convert(root).split("\n")
+        assert len(lines) == 3001
+        assert lines[-1] == "  " * 3000 + "- Level 3000"
+
+    def test_convert_into_writes_same_text(self, converter):
+        """convert_intoで書き出したテキストはconvertの結果と同じになる"""
+        root = Node(text="ルート")
+        child = Node(text="子")
+        root.add_child(child)
+        child.add_child(Node(text="孫"))
+
+        chunks = []
+        converter.convert_into(root, chunks.append)
+        assert "".join(chunks) == converter.convert(root)
+
+    def test_convert_into_none_writes_nothing(self, converter):
+        """ルートがNoneの場合は何も書き出さない"""
+        chunks = []
+        converter.convert_into(None, chunks.append)
+        assert chunks == []
@@ -0,0 +1,113 @@
+"""
+NodeQuadTreeクラスのテスト
+
+NodeQuadTreeはノードアイテムの矩形を管理し、座標を含むアイテムを検索する4分木
+"""
+import pytest
+from PyQt6.QtCore import QRectF, QPointF
+from src.presentation.spatial import NodeQuadTree, _MAX_ENTRIES, _MAX_DEPTH
+
+
+@pytest.fixture
+def tree():
+    """(0, 0)から(100, 100)までを管理する4分木"""
+    return NodeQuadTree(QRectF(0, 0, 100, 100))
+
+
+def _fill_quadrants(tree):
+    """4つの区画に小さな矩形を入れて分割させ、入れたアイテムを返す"""
+    items = []
+    for i in range(_MAX_ENTRIES + 1):
+        x = 10 if i % 2 == 0 else 60
+        y = 10 if i % 4 < 2 else 60
+        item = f"item{i}"
+        tree.insert(QRectF(x + i, y + i, 2, 2), item)
+        items.append((QPointF(x + i + 1, y + i + 1), item))
+    return items
+
+
+class TestNodeQuadTreeQuery:
+    """検索に関するテスト"""
+
+    def test_query_after_insert(self, tree):
+        """追加した矩形に含まれる座標でアイテムが見つかる"""
+        tree.insert(QRectF(10, 10, 5, 5), "a")
+        tree.insert(QRectF(70, 70, 5, 5), "b")
+
+        assert tree.query(QPointF(12, 12)) == ["a"]
+        assert tree.query(QPointF(72, 72)) == ["b"]
+        assert tree.query(QPointF(50, 50)) == []
+
+    def test_query_reuses_results_list(self, tree):
+        """結果のリストを渡すと中身を入れ替えて返す"""
+        tree.insert(QRectF(10, 10, 5, 5), "a")
+        results = ["古い結果"]
+
+        returned = tree.query(QPointF(12, 12), results)
+
+        assert returned is results
+        assert results == ["a"]
+
+    def test_query_point_on_edge(self, tree):
+        """矩形の辺上の座標も矩形に含まれる"""
+        tree.insert(QRectF(10, 10, 5, 5), "a")
+
+        assert tree.query(QPointF(10, 10)) == ["a"]
+        assert tree.query(QPointF(15, 15)) == ["a"]
+
+    def test_query_point_outside_root(self, tree):
+        """管理範囲の外の座標では、範囲内のアイテムは見つからない"""
+        tree.insert(QRectF(10, 10, 5, 5), "a")
+
+        assert tree.query(QPointF(150, 150)) == []
+        assert tree.query(QPointF(-1, 12)) == []
+
+    def test_rect_outside_root_is_still_found(self, tree):
+        """管理範囲の外に追加した矩形もルートに残り、検索できる"""
+        tree.insert(QRectF(200, 200, 10, 10), "outside")
+
+        assert tree.query(QPointF(205, 205)) == ["outside"]
+
+
+class TestNodeQuadTreeSplit:
+    """区画の分割に関するテスト"""
+
+    def test_split_when_too_many_entries(self, tree):
+        """上限を超えて追加すると分割され、分割後も全てのアイテムが見つかる"""
+        items = _fill_quadrants(tree)
+
+        assert tree._children is not None
+        for point, item in items:
+            assert tree.query(point) == [item]
+
+    def test_straddling_entry_stays_in_parent(self, tree):
+        """区画の境界をまたぐ矩形は親の区画に残り、どちら側の座標でも見つかる"""
+        _fill_quadrants(tree)
+        tree.insert(QRectF(45, 45, 10, 10), "straddle")
+
+        assert (QRectF(45, 45, 10, 10), "straddle") in tree._entries
+        assert tree.query(QPointF(46, 46)) == ["straddle"]
+        assert tree.query(QPointF(54, 54)) == ["straddle"]
+
+    def test_query_point_on_quadrant_boundary(self, tree):
+        """区画の境界上の座標では、両側の区画のアイテムが見つかる"""
+        _fill_quadrants(tree)
+        tree.insert(QRectF(40, 40, 10, 10), "top_left")
+        tree.insert(QRectF(50, 50, 10, 10), "bottom_right")
+
+        assert sorted(tree.query(QPointF(50, 50))) == ["bottom_right", "top_left"]
+
+    def test_split_stops_at_max_depth(self, tree):
+        """同じ場所に矩形を追加し続けても、分割は深さの上限で止まる"""
+        count = _MAX_ENTRIES * 3
+        for i in range(count):
+            tree.insert(QRectF(1, 1, 0.1, 0.1), i)
+
+        # 矩形が入っている区画まで下りる
+        node = tree
+        while node._children is not None:
+            node = next(child for child in node._children if child._entries or child._children)
+
+        assert node._depth == _MAX_DEPTH
+        assert len(node._entries) == count
+        assert sorted(tree.query(QPointF(1.05, 1.05))) == list(range(count))